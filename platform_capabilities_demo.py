@@ -3,16 +3,148 @@ Aictive Platform V2 - Comprehensive Capabilities Demonstration
 Shows all the features we've built with Super Claude and Swarms
 """
 
-import os
-import yaml
-import json
-from datetime import datetime
 from typing import Dict, List, Any
 
 
+def _load_yaml(path: str) -> Any:
+    """Parse a YAML file, preferring a native parser when one is installed; bad YAML raises ValueError"""
+    try:
+        import yaml_rs
+    except ImportError:
+        pass
+    else:
+        with open(path, "r") as f:
+            return yaml_rs.loads(f.read())
+    
+    # Imported lazily: PyYAML is only needed when a YAML file is loaded
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r") as f:
+        try:
+            return yaml.load(f, Loader=loader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {path}: {e}") from e
+
+
+# Static feature catalogue shown by the demo
+_PLATFORM_FEATURES: Dict[str, Any] = {
+    "core_capabilities": {
+        "ai_orchestration": {
+            "description": "Multi-agent AI orchestration with 20 specialized agents",
+            "agents": [
+                "President (unlimited approval)",
+                "VP of Operations", 
+                "Directors (Accounting, Leasing)",
+                "Property Managers",
+                "Maintenance Team (Supervisor, Tech Lead, Technicians)",
+                "Leasing Team (Manager, Senior Agent, Agents)",
+                "Accounting Team (Manager, Accountants)",
+                "Support Staff (Admin, Resident Services)"
+            ],
+            "features": [
+                "Hierarchical approval chains",
+                "Inter-agent messaging",
+                "Role-based permissions",
+                "Audit trail for all decisions"
+            ]
+        },
+        
+        "workflow_automation": {
+            "description": "Comprehensive workflow automation system",
+            "workflows": [
+                "Emergency Maintenance Response",
+                "Lease Application Processing",
+                "Financial Approvals",
+                "Strategic Planning",
+                "Compliance Audits",
+                "Seasonal Operations"
+            ],
+            "capabilities": [
+                "Parallel step execution",
+                "Conditional branching",
+                "Timeout management",
+                "Automatic escalation"
+            ]
+        },
+        
+        "swarm_intelligence": {
+            "description": "AI swarm coordination for complex decisions",
+            "use_cases": [
+                "Complex workflow design",
+                "Multi-factor decision making",
+                "Pattern recognition",
+                "Optimization problems"
+            ],
+            "swarm_agents": [
+                "Requirements Analyst",
+                "Process Designer",
+                "Compliance Validator",
+                "Efficiency Optimizer",
+                "Integration Specialist"
+            ]
+        }
+    },
+    
+    "integrations": {
+        "external_systems": [
+            "RentVine (Property Management)",
+            "Slack (Notifications & Approvals)",
+            "Email Systems",
+            "Accounting Software",
+            "Maintenance Vendors"
+        ],
+        
+        "ai_providers": [
+            "Anthropic Claude (Primary)",
+            "OpenAI GPT-4 (Backup)",
+            "Groq (Fast inference)",
+            "Perplexity (Research)"
+        ],
+        
+        "databases": [
+            "Supabase (Primary)",
+            "PostgreSQL (Direct)",
+            "Redis (Caching)",
+            "Vector DB (AI Memory)"
+        ]
+    },
+    
+    "ui_components": {
+        "command_center": {
+            "description": "Real-time operations monitoring",
+            "features": [
+                "Vacancy tracking dashboard",
+                "Response time monitoring",
+                "Workflow visualization",
+                "AI decision queue"
+            ]
+        },
+        
+        "react_frontend": {
+            "description": "Modern React-based UI",
+            "pages": [
+                "Dashboard",
+                "Workflows",
+                "Analytics",
+                "Settings"
+            ]
+        }
+    }
+}
+
+# Section keys title-cased once, e.g. "ai_orchestration" -> "Ai Orchestration"
+_FEATURE_TITLES = {
+    key: key.replace('_', ' ').title()
+    for section in ("core_capabilities", "integrations", "ui_components")
+    for key in _PLATFORM_FEATURES[section]
+}
+
+
 class AictivePlatformDemo:
     """Demonstrate all platform capabilities"""
     
+    __slots__ = ("features", "workflows", "agents")
+    
     def __init__(self):
         self.features = self._load_features()
         self.workflows = self._load_workflows()
@@ -20,110 +152,7 @@ class AictivePlatformDemo:
     
     def _load_features(self) -> Dict[str, Any]:
         """Load all platform features"""
-        return {
-            "core_capabilities": {
-                "ai_orchestration": {
-                    "description": "Multi-agent AI orchestration with 20 specialized agents",
-                    "agents": [
-                        "President (unlimited approval)",
-                        "VP of Operations", 
-                        "Directors (Accounting, Leasing)",
-                        "Property Managers",
-                        "Maintenance Team (Supervisor, Tech Lead, Technicians)",
-                        "Leasing Team (Manager, Senior Agent, Agents)",
-                        "Accounting Team (Manager, Accountants)",
-                        "Support Staff (Admin, Resident Services)"
-                    ],
-                    "features": [
-                        "Hierarchical approval chains",
-                        "Inter-agent messaging",
-                        "Role-based permissions",
-                        "Audit trail for all decisions"
-                    ]
-                },
-                
-                "workflow_automation": {
-                    "description": "Comprehensive workflow automation system",
-                    "workflows": [
-                        "Emergency Maintenance Response",
-                        "Lease Application Processing",
-                        "Financial Approvals",
-                        "Strategic Planning",
-                        "Compliance Audits",
-                        "Seasonal Operations"
-                    ],
-                    "capabilities": [
-                        "Parallel step execution",
-                        "Conditional branching",
-                        "Timeout management",
-                        "Automatic escalation"
-                    ]
-                },
-                
-                "swarm_intelligence": {
-                    "description": "AI swarm coordination for complex decisions",
-                    "use_cases": [
-                        "Complex workflow design",
-                        "Multi-factor decision making",
-                        "Pattern recognition",
-                        "Optimization problems"
-                    ],
-                    "swarm_agents": [
-                        "Requirements Analyst",
-                        "Process Designer",
-                        "Compliance Validator",
-                        "Efficiency Optimizer",
-                        "Integration Specialist"
-                    ]
-                }
-            },
-            
-            "integrations": {
-                "external_systems": [
-                    "RentVine (Property Management)",
-                    "Slack (Notifications & Approvals)",
-                    "Email Systems",
-                    "Accounting Software",
-                    "Maintenance Vendors"
-                ],
-                
-                "ai_providers": [
-                    "Anthropic Claude (Primary)",
-                    "OpenAI GPT-4 (Backup)",
-                    "Groq (Fast inference)",
-                    "Perplexity (Research)"
-                ],
-                
-                "databases": [
-                    "Supabase (Primary)",
-                    "PostgreSQL (Direct)",
-                    "Redis (Caching)",
-                    "Vector DB (AI Memory)"
-                ]
-            },
-            
-            "ui_components": {
-                "command_center": {
-                    "description": "Real-time operations monitoring",
-                    "features": [
-                        "Vacancy tracking dashboard",
-                        "Response time monitoring",
-                        "Workflow visualization",
-                        "AI decision queue"
-                    ]
-                },
-                
-                "react_frontend": {
-                    "description": "Modern React-based UI",
-                    "pages": [
-                        "Dashboard",
-                        "Workflows",
-                        "Analytics",
-                        "Settings"
-                    ]
-                }
-            }
-        }
+        return _PLATFORM_FEATURES
     
     def _load_workflows(self) -> List[Dict[str, Any]]:
         """Load workflow examples"""
@@ -165,98 +194,95 @@ class AictivePlatformDemo:
     def _load_agents(self) -> Dict[str, Any]:
         """Load agent hierarchy"""
         try:
-            with open("agent_knowledge_base.yaml", "r") as f:
-                kb = yaml.safe_load(f)
-                return kb.get("agents", {})
-        except:
+            kb = _load_yaml("agent_knowledge_base.yaml")
+        except (OSError, ImportError, ValueError):
+            # Missing or unreadable file, no YAML parser installed, or malformed YAML
             return {}
+        return kb.get("agents", {}) if isinstance(kb, dict) else {}
     
     def demonstrate_capabilities(self):
         """Run comprehensive demonstration"""
-        print("🚀 AICTIVE PLATFORM V2 - COMPREHENSIVE CAPABILITIES")
-        print("=" * 80)
-        print("AI-Powered Property Management with Super Claude & Swarm Intelligence")
-        print("=" * 80)
+        # Collect every line and write the report once at the end
+        out: List[str] = []
+        w = out.append
+        
+        w("🚀 AICTIVE PLATFORM V2 - COMPREHENSIVE CAPABILITIES")
+        w("=" * 80)
+        w("AI-Powered Property Management with Super Claude & Swarm Intelligence")
+        w("=" * 80)
         
         # 1. Core Capabilities
-        print("\n📊 CORE CAPABILITIES")
-        print("-" * 60)
+        w("\n📊 CORE CAPABILITIES")
+        w("-" * 60)
         
         for capability, details in self.features["core_capabilities"].items():
-            print(f"\n🔹 {capability.replace('_', ' ').title()}")
-            print(f"   {details['description']}")
+            w(f"\n🔹 {_FEATURE_TITLES[capability]}")
+            w(f"   {details['description']}")
             
             if capability == "ai_orchestration":
-                print(f"\n   👥 Agent Hierarchy ({len(details['agents'])} agents):")
-                for agent in details['agents'][:5]:
-                    print(f"      • {agent}")
-                print(f"      ... and {len(details['agents']) - 5} more")
+                w(f"\n   👥 Agent Hierarchy ({len(details['agents'])} agents):")
+                out.extend([f"      • {agent}" for agent in details['agents'][:5]])
+                w(f"      ... and {len(details['agents']) - 5} more")
             
             if "features" in details:
-                print(f"\n   ✨ Key Features:")
-                for feature in details['features']:
-                    print(f"      • {feature}")
+                w(f"\n   ✨ Key Features:")
+                out.extend([f"      • {feature}" for feature in details['features']])
         
         # 2. Workflow Examples
-        print("\n\n📋 WORKFLOW AUTOMATION EXAMPLES")
-        print("-" * 60)
+        w("\n\n📋 WORKFLOW AUTOMATION EXAMPLES")
+        w("-" * 60)
         
         for workflow in self.workflows[:2]:
-            print(f"\n🔸 {workflow['name']}")
-            print(f"   Complexity: {workflow['complexity']}")
-            print(f"   Agents: {workflow['agents_involved']}")
-            print(f"   Time: {workflow['average_time']}")
+            w(f"\n🔸 {workflow['name']}")
+            w(f"   Complexity: {workflow['complexity']}")
+            w(f"   Agents: {workflow['agents_involved']}")
+            w(f"   Time: {workflow['average_time']}")
             
-            print(f"\n   Steps:")
-            for i, step in enumerate(workflow['steps'][:3], 1):
-                print(f"   {i}. {step}")
+            w(f"\n   Steps:")
+            out.extend([f"   {i}. {step}" for i, step in enumerate(workflow['steps'][:3], 1)])
             if len(workflow['steps']) > 3:
-                print(f"   ... and {len(workflow['steps']) - 3} more steps")
+                w(f"   ... and {len(workflow['steps']) - 3} more steps")
         
         # 3. Swarm Intelligence
-        print("\n\n🐝 SWARM INTELLIGENCE SYSTEM")
-        print("-" * 60)
+        w("\n\n🐝 SWARM INTELLIGENCE SYSTEM")
+        w("-" * 60)
         
         swarm = self.features["core_capabilities"]["swarm_intelligence"]
-        print(f"Description: {swarm['description']}")
+        w(f"Description: {swarm['description']}")
         
-        print("\n📌 Use Cases:")
-        for use_case in swarm["use_cases"]:
-            print(f"   • {use_case}")
+        w("\n📌 Use Cases:")
+        out.extend([f"   • {use_case}" for use_case in swarm["use_cases"]])
         
-        print("\n🤖 Swarm Agents:")
-        for agent in swarm["swarm_agents"]:
-            print(f"   • {agent}")
+        w("\n🤖 Swarm Agents:")
+        out.extend([f"   • {agent}" for agent in swarm["swarm_agents"]])
         
         # 4. Integration Ecosystem
-        print("\n\n🔗 INTEGRATION ECOSYSTEM")
-        print("-" * 60)
+        w("\n\n🔗 INTEGRATION ECOSYSTEM")
+        w("-" * 60)
         
         integrations = self.features["integrations"]
         for category, systems in integrations.items():
-            print(f"\n{category.replace('_', ' ').title()}:")
-            for system in systems[:3]:
-                print(f"   • {system}")
+            w(f"\n{_FEATURE_TITLES[category]}:")
+            out.extend([f"   • {system}" for system in systems[:3]])
             if len(systems) > 3:
-                print(f"   ... and {len(systems) - 3} more")
+                w(f"   ... and {len(systems) - 3} more")
         
         # 5. UI Components
-        print("\n\n🎨 USER INTERFACE COMPONENTS")
-        print("-" * 60)
+        w("\n\n🎨 USER INTERFACE COMPONENTS")
+        w("-" * 60)
         
         ui = self.features["ui_components"]
         for component, details in ui.items():
-            print(f"\n{component.replace('_', ' ').title()}:")
-            print(f"   {details['description']}")
+            w(f"\n{_FEATURE_TITLES[component]}:")
+            w(f"   {details['description']}")
             
             if "features" in details:
-                print("   Features:")
-                for feature in details["features"]:
-                    print(f"      • {feature}")
+                w("   Features:")
+                out.extend([f"      • {feature}" for feature in details["features"]])
         
         # 6. Key Statistics
-        print("\n\n📈 PLATFORM STATISTICS")
-        print("-" * 60)
+        w("\n\n📈 PLATFORM STATISTICS")
+        w("-" * 60)
         
         stats = {
             "Total Agents": 20,
@@ -269,12 +295,11 @@ class AictivePlatformDemo:
             "Property Types": "1-50 units"
         }
         
-        for stat, value in stats.items():
-            print(f"   {stat}: {value}")
+        out.extend([f"   {stat}: {value}" for stat, value in stats.items()])
         
         # 7. Business Impact
-        print("\n\n💼 BUSINESS IMPACT")
-        print("-" * 60)
+        w("\n\n💼 BUSINESS IMPACT")
+        w("-" * 60)
         
         impacts = [
             "⚡ 75% faster emergency response times",
@@ -285,29 +310,30 @@ class AictivePlatformDemo:
             "📈 Real-time vacancy tracking prevents revenue loss"
         ]
         
-        for impact in impacts:
-            print(f"   {impact}")
+        out.extend([f"   {impact}" for impact in impacts])
         
         # 8. Next Steps
-        print("\n\n🚀 READY FOR DEPLOYMENT")
-        print("-" * 60)
-        print("   ✅ All agents implemented and tested")
-        print("   ✅ Workflow orchestration operational")
-        print("   ✅ Swarm intelligence integrated")
-        print("   ✅ UI components ready")
-        print("   ✅ Mock mode for development")
-        print("   ✅ Production deployment guides available")
+        w("\n\n🚀 READY FOR DEPLOYMENT")
+        w("-" * 60)
+        w("   ✅ All agents implemented and tested")
+        w("   ✅ Workflow orchestration operational")
+        w("   ✅ Swarm intelligence integrated")
+        w("   ✅ UI components ready")
+        w("   ✅ Mock mode for development")
+        w("   ✅ Production deployment guides available")
+        
+        w("\n\n🌟 RECOMMENDATIONS FOR CURSOR DEVELOPMENT")
+        w("-" * 60)
+        w("   1. Use the YAML knowledge base for agent context")
+        w("   2. Leverage swarm system for complex workflows")
+        w("   3. Build on existing workflow templates")
+        w("   4. Test with mock services first")
+        w("   5. Use the command center UI for monitoring")
         
-        print("\n\n🌟 RECOMMENDATIONS FOR CURSOR DEVELOPMENT")
-        print("-" * 60)
-        print("   1. Use the YAML knowledge base for agent context")
-        print("   2. Leverage swarm system for complex workflows")
-        print("   3. Build on existing workflow templates")
-        print("   4. Test with mock services first")
-        print("   5. Use the command center UI for monitoring")
+        w("\n✨ The Aictive Platform V2 is ready for advanced development!")
+        w("🎯 Continue building with Cursor's AI assistance!")
         
-        print("\n✨ The Aictive Platform V2 is ready for advanced development!")
-        print("🎯 Continue building with Cursor's AI assistance!")
+        print("\n".join(out))
 
 
 def main():
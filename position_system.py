@@ -1,10 +1,11 @@
 """
 Position-based logic and department routing system
 """
+import time
+from collections import ChainMap
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
-from datetime import datetime
 
 class Department(str, Enum):
     """Available departments in property management"""
@@ -33,6 +34,12 @@ class Position(str, Enum):
     CUSTOMER_SERVICE_REP = "customer_service_rep"
     SECURITY_OFFICER = "security_officer"
 
+# Raw values and display titles, e.g. Position.PROPERTY_MANAGER -> "Property Manager"
+_POS_VALUE = {p: p.value for p in Position}
+_DEPT_VALUE = {d: d.value for d in Department}
+_POSITION_TITLE = {p: v.replace('_', ' ').title() for p, v in _POS_VALUE.items()}
+_DEPT_TITLE = {d: v.replace('_', ' ').title() for d, v in _DEPT_VALUE.items()}
+
 class ResponsePermission(BaseModel):
     """Defines what a position can do"""
     can_approve_maintenance: bool = False
@@ -45,6 +52,11 @@ class ResponsePermission(BaseModel):
     max_approval_amount: float = 0.0
     requires_approval_from: Optional[Position] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResponsePermission":
+        """Build from a raw dict using the model's compiled validator"""
+        return cls.model_validate(data)
+
 # Position permissions matrix
 POSITION_PERMISSIONS = {
     Position.PROPERTY_MANAGER: ResponsePermission(
@@ -92,6 +104,10 @@ POSITION_PERMISSIONS = {
     )
 }
 
+# Dense position index -> permissions; positions without an entry get no permissions
+_POS_INDEX = {p: i for i, p in enumerate(Position)}
+_PERMS_BY_INDEX = tuple(POSITION_PERMISSIONS.get(p, ResponsePermission()) for p in Position)
+
 class FormTemplate(BaseModel):
     """Form templates for different scenarios"""
     id: str
@@ -102,6 +118,11 @@ class FormTemplate(BaseModel):
     content: Optional[str] = None
     positions_can_use: List[Position]
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FormTemplate":
+        """Build from a raw dict using the model's compiled validator"""
+        return cls.model_validate(data)
+
 # Standard forms library
 STANDARD_FORMS = {
     "maintenance_request": FormTemplate(
@@ -201,41 +222,121 @@ DEPARTMENT_SOPS = {
     )
 }
 
+# Email category -> handling department, positions and SOP key
+_ROUTING_RULES = {
+    "maintenance": {
+        "department": Department.MAINTENANCE,
+        "positions": [Position.MAINTENANCE_TECH, Position.MAINTENANCE_SUPERVISOR],
+        "sop": "standard_maintenance"
+    },
+    "payment": {
+        "department": Department.ACCOUNTING,
+        "positions": [Position.ACCOUNTANT, Position.ACCOUNTING_MANAGER],
+        "sop": "rent_payment_late"
+    },
+    "lease": {
+        "department": Department.LEASING,
+        "positions": [Position.LEASING_AGENT, Position.LEASING_MANAGER],
+        "sop": "lease_renewal_request"
+    },
+    "general": {
+        "department": Department.CUSTOMER_SERVICE,
+        "positions": [Position.CUSTOMER_SERVICE_REP],
+        "sop": "general_inquiry"
+    }
+}
+
+# Response templates, filled with str.format_map at response time
+_MAINT_APPROVE_TMPL = """
+Dear {tenant_name},
+
+Thank you for reporting the {issue}. 
+
+I have approved the repair request and our maintenance team will address this issue.
+
+Work Order #: {work_order_id}
+Scheduled Time: {scheduled_time}
+Technician: {technician}
+
+Please ensure someone is available to provide access to the unit.
+
+Best regards,
+{position_title}
+{dept_title} Department
+"""
+
+_PAYMENT_PLAN_TMPL = """
+Dear {tenant_name},
+
+I understand your current situation regarding the rent payment.
+
+I'm pleased to inform you that we can offer you a payment plan for the outstanding balance.
+
+Current Balance: ${balance}
+Payment Plan: {plan_details}
+
+Please find the attached payment plan agreement. Kindly review, sign, and return it within 48 hours.
+
+Best regards,
+{position_title}
+{dept_title} Department
+"""
+
+# Fallback values for template fields missing from the email context
+_TEMPLATE_DEFAULTS = {
+    "tenant_name": "Tenant",
+    "issue": "maintenance issue",
+    "scheduled_time": "Within 24-48 hours",
+    "technician": "Will be assigned",
+    "balance": "0.00",
+    "plan_details": "To be discussed",
+}
+
+# (epoch minute, work order id) for the most recently generated default id
+_last_work_order_id = (-1, "")
+
+def _default_work_order_id() -> str:
+    """Timestamped work order id, formatted at most once per minute"""
+    global _last_work_order_id
+    minute = int(time.time() // 60)
+    if _last_work_order_id[0] != minute:
+        _last_work_order_id = (minute, time.strftime('WO-%Y%m%d%H%M'))
+    return _last_work_order_id[1]
+
+def _resp_maint_approve(ctx: ChainMap) -> str:
+    """Repair approval reply; generates a work order id if none was given"""
+    if "work_order_id" not in ctx:
+        ctx = ctx.new_child({"work_order_id": _default_work_order_id()})
+    return _MAINT_APPROVE_TMPL.format_map(ctx)
+
+def _resp_payment_plan(ctx: ChainMap) -> str:
+    """Payment plan offer reply"""
+    return _PAYMENT_PLAN_TMPL.format_map(ctx)
+
+# (email category, selected action) -> response template builder
+_RESPONSE_HANDLERS = {
+    ("maintenance", "Approve repair"): _resp_maint_approve,
+    ("payment", "Approve payment plan"): _resp_payment_plan,
+}
+
 class ResponseRouter:
     """Routes emails to appropriate department and generates responses based on position"""
     
     @staticmethod
     def route_to_department(email_category: str, urgency: str) -> Dict[str, Any]:
-        """Determine which department should handle the email"""
-        routing_rules = {
-            "maintenance": {
-                "department": Department.MAINTENANCE,
-                "positions": [Position.MAINTENANCE_TECH, Position.MAINTENANCE_SUPERVISOR],
-                "sop": "emergency_maintenance" if urgency == "emergency" else "standard_maintenance"
-            },
-            "payment": {
-                "department": Department.ACCOUNTING,
-                "positions": [Position.ACCOUNTANT, Position.ACCOUNTING_MANAGER],
-                "sop": "rent_payment_late"
-            },
-            "lease": {
-                "department": Department.LEASING,
-                "positions": [Position.LEASING_AGENT, Position.LEASING_MANAGER],
-                "sop": "lease_renewal_request"
-            },
-            "general": {
-                "department": Department.CUSTOMER_SERVICE,
-                "positions": [Position.CUSTOMER_SERVICE_REP],
-                "sop": "general_inquiry"
-            }
-        }
+        """Determine which department should handle the email.
         
-        return routing_rules.get(email_category, routing_rules["general"])
+        The returned rule is shared between calls and must not be mutated.
+        """
+        rule = _ROUTING_RULES.get(email_category, _ROUTING_RULES["general"])
+        if email_category == "maintenance" and urgency == "emergency":
+            return {**rule, "sop": "emergency_maintenance"}
+        return rule
     
     @staticmethod
     def get_position_response_options(position: Position, email_category: str) -> Dict[str, Any]:
         """Get available response options based on position"""
-        permissions = POSITION_PERMISSIONS.get(position)
+        permissions = _PERMS_BY_INDEX[_POS_INDEX[position]]
         available_forms = []
         available_actions = []
         
@@ -288,62 +389,35 @@ class ResponseRouter:
     ) -> Dict[str, Any]:
         """Generate a response template based on position and selected action"""
         
-        permissions = POSITION_PERMISSIONS.get(position)
-        routing = ResponseRouter.route_to_department(email_category, email_context.get("urgency", "medium"))
-        sop = DEPARTMENT_SOPS.get(routing["sop"])
+        permissions = _PERMS_BY_INDEX[_POS_INDEX[position]]
+        emergency = email_context.get("urgency", "medium") == "emergency"
+        routing, sop = _CATEGORY_BUNDLE.get((email_category, emergency)) or _CATEGORY_BUNDLE[("general", emergency)]
         
         # Build response
         response = {
-            "from_position": position.value,
-            "from_department": routing["department"].value,
+            "from_position": _POS_VALUE[position],
+            "from_department": _DEPT_VALUE[routing["department"]],
             "action": selected_action,
             "attachments": selected_forms,
             "requires_approval": permissions.requires_approval_from is not None,
-            "approval_position": permissions.requires_approval_from.value if permissions.requires_approval_from else None,
+            "approval_position": _POS_VALUE[permissions.requires_approval_from] if permissions.requires_approval_from else None,
             "sop_reference": sop.id if sop else None,
             "response_template": "",
             "next_steps": []
         }
         
         # Generate appropriate response template
-        if email_category == "maintenance":
-            if selected_action == "Approve repair":
-                response["response_template"] = f"""
-Dear {email_context.get('tenant_name', 'Tenant')},
-
-Thank you for reporting the {email_context.get('issue', 'maintenance issue')}. 
-
-I have approved the repair request and our maintenance team will address this issue.
-
-Work Order #: {email_context.get('work_order_id', 'WO-' + datetime.now().strftime('%Y%m%d%H%M'))}
-Scheduled Time: {email_context.get('scheduled_time', 'Within 24-48 hours')}
-Technician: {email_context.get('technician', 'Will be assigned')}
-
-Please ensure someone is available to provide access to the unit.
-
-Best regards,
-{position.value.replace('_', ' ').title()}
-{routing['department'].value.replace('_', ' ').title()} Department
-"""
-            
-        elif email_category == "payment":
-            if selected_action == "Approve payment plan":
-                response["response_template"] = f"""
-Dear {email_context.get('tenant_name', 'Tenant')},
-
-I understand your current situation regarding the rent payment.
-
-I'm pleased to inform you that we can offer you a payment plan for the outstanding balance.
-
-Current Balance: ${email_context.get('balance', '0.00')}
-Payment Plan: {email_context.get('plan_details', 'To be discussed')}
-
-Please find the attached payment plan agreement. Kindly review, sign, and return it within 48 hours.
-
-Best regards,
-{position.value.replace('_', ' ').title()}
-{routing['department'].value.replace('_', ' ').title()} Department
-"""
+        ctx = ChainMap(
+            {
+                "position_title": _POSITION_TITLE[position],
+                "dept_title": _DEPT_TITLE[routing['department']],
+            },
+            email_context,
+            _TEMPLATE_DEFAULTS,
+        )
+        handler = _RESPONSE_HANDLERS.get((email_category, selected_action))
+        if handler:
+            response["response_template"] = handler(ctx)
         
         # Add next steps from SOP
         if sop:
@@ -351,6 +425,17 @@ Best regards,
         
         return response
 
+def _build_category_bundle() -> Dict[Any, Any]:
+    """Precompute (routing, sop) for every (category, is_emergency) pair"""
+    bundle = {}
+    for category in _ROUTING_RULES:
+        for emergency in (False, True):
+            routing = ResponseRouter.route_to_department(category, "emergency" if emergency else "medium")
+            bundle[(category, emergency)] = (routing, DEPARTMENT_SOPS.get(routing["sop"]))
+    return bundle
+
+_CATEGORY_BUNDLE = _build_category_bundle()
+
 # Example usage function
 def process_email_with_position(
     email_category: str,
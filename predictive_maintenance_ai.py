@@ -4,22 +4,37 @@ Time series analysis and ML for equipment failure prediction and maintenance opt
 """
 
 import asyncio
+import heapq
 import json
+import re
 import numpy as np
+import orjson
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import logging
 from collections import defaultdict
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.seasonal import seasonal_decompose
-import prophet
+from functools import lru_cache
 import joblib
 
+# ONNX Runtime serves inference for fitted models when available
+try:
+    import onnxruntime
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Numba compiles the per-series numeric kernels when available
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from rentvine_api_client import RentVineAPIClient
 from webhook_workflow_engine import WebhookWorkflowEngine
 from production_monitoring import MetricsCollector
@@ -49,6 +64,23 @@ class MaintenanceUrgency(Enum):
     PREVENTIVE = "preventive"
 
 
+def _parse_record_date(record: Dict[str, Any]):
+    """Convert an ISO-format "date" on a maintenance record to a datetime in place"""
+    date = record.get("date")
+    if isinstance(date, str):
+        record["date"] = datetime.fromisoformat(date)
+
+
+# Urgency for each code returned by PredictiveMaintenanceAI._determine_urgency_codes
+_URGENCY_BY_CODE = (
+    MaintenanceUrgency.EMERGENCY,
+    MaintenanceUrgency.HIGH,
+    MaintenanceUrgency.MEDIUM,
+    MaintenanceUrgency.LOW,
+    MaintenanceUrgency.PREVENTIVE
+)
+
+
 @dataclass
 class EquipmentProfile:
     """Profile for equipment/asset"""
@@ -63,11 +95,125 @@ class EquipmentProfile:
     sensor_data: Dict[str, List[float]] = field(default_factory=dict)
     failure_risk_score: float = 0.0
     next_maintenance_date: Optional[datetime] = None
+    # Most recent record in maintenance_history, kept current on append
+    latest_maintenance: Optional[Dict[str, Any]] = None
+    # Bumped by set_maintenance_history / add_maintenance_record; keys the feature cache
+    _history_version: int = field(default=0, init=False, repr=False, compare=False)
+    # (revision key, feature vector) from the last feature extraction
+    _feature_cache: Optional[Tuple[Tuple[Any, ...], np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        if self.maintenance_history and self.latest_maintenance is None:
+            self.set_maintenance_history(self.maintenance_history)
+    
+    def set_maintenance_history(self, history: List[Dict[str, Any]]):
+        """Replace the maintenance history and locate its most recent record"""
+        for record in history:
+            _parse_record_date(record)
+        self.maintenance_history = history
+        self._history_version += 1
+        self.latest_maintenance = max(
+            history,
+            key=lambda m: m.get("date", datetime.min),
+            default=None
+        )
+    
+    def add_maintenance_record(self, record: Dict[str, Any]):
+        """Append a maintenance record, keeping latest_maintenance current"""
+        _parse_record_date(record)
+        self.maintenance_history.append(record)
+        self._history_version += 1
+        if (
+            self.latest_maintenance is None or
+            record.get("date", datetime.min) > self.latest_maintenance.get("date", datetime.min)
+        ):
+            self.latest_maintenance = record
+
+
+# Keyword -> category, scanned in order; the first keyword found in the type wins
+_KEYWORD_ITEMS: Tuple[Tuple[str, MaintenanceCategory], ...] = tuple(
+    (keyword, category)
+    for category, keywords in (
+        (MaintenanceCategory.HVAC, ("hvac", "ac", "heating", "cooling", "furnace")),
+        (MaintenanceCategory.PLUMBING, ("plumb", "pipe", "water", "drain")),
+        (MaintenanceCategory.ELECTRICAL, ("electric", "wire", "circuit", "outlet")),
+        (MaintenanceCategory.APPLIANCES, ("appliance", "refrigerator", "washer", "dryer", "dishwasher")),
+        (MaintenanceCategory.STRUCTURAL, ("struct", "roof", "foundation", "wall")),
+        (MaintenanceCategory.LANDSCAPING, ("landscape", "lawn", "garden", "irrigation")),
+        (MaintenanceCategory.SAFETY, ("safety", "security", "fire", "alarm")),
+    )
+    for keyword in keywords
+)
+
+
+@lru_cache(maxsize=1024)
+def _equipment_category(type_lower: str) -> MaintenanceCategory:
+    """Map a lowercased equipment type to its maintenance category"""
+    for keyword, category in _KEYWORD_ITEMS:
+        if keyword in type_lower:
+            return category
+    return MaintenanceCategory.GENERAL
+
+
+# Expected lifespan in years, matched by substring of the equipment type
+_LIFESPANS = {
+    "hvac": 15,
+    "water_heater": 10,
+    "refrigerator": 13,
+    "washer": 10,
+    "dryer": 13,
+    "dishwasher": 9,
+    "roof": 20,
+    "plumbing": 50,
+    "electrical": 30
+}
+# Longest keys first so the alternation prefers the most specific key at a position
+_LIFESPAN_ITEMS: Tuple[Tuple[str, int], ...] = tuple(
+    sorted(_LIFESPANS.items(), key=lambda item: -len(item[0]))
+)
+_LIFESPAN_RE = re.compile("|".join(re.escape(key) for key, _ in _LIFESPAN_ITEMS))
+
+
+@lru_cache(maxsize=1024)
+def _expected_lifespan(type_lower: str) -> float:
+    """Expected lifespan in years for a lowercased equipment type"""
+    match = _LIFESPAN_RE.search(type_lower)
+    return _LIFESPANS[match.group(0)] if match else 15  # Default 15 years
+
+
+# Base maintenance cost by category value
+_BASE_COSTS = {
+    "hvac": 500,
+    "plumbing": 300,
+    "electrical": 400,
+    "appliances": 250,
+    "structural": 1000,
+    "landscaping": 150,
+    "general": 200
+}
+
+# Cost multiplier by urgency
+_URGENCY_COST_MULTIPLIERS = {
+    MaintenanceUrgency.EMERGENCY: 2.0,
+    MaintenanceUrgency.HIGH: 1.5,
+    MaintenanceUrgency.MEDIUM: 1.2,
+    MaintenanceUrgency.LOW: 1.0,
+    MaintenanceUrgency.PREVENTIVE: 0.8
+}
 
 
 @dataclass
 class MaintenancePrediction:
     """Prediction for maintenance needs"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        "equipment_id", "prediction_date", "failure_probability",
+        "remaining_useful_life_days", "recommended_action", "urgency",
+        "estimated_cost", "confidence_score", "risk_factors"
+    )
+    
     equipment_id: str
     prediction_date: datetime
     failure_probability: float
@@ -94,9 +240,70 @@ class MaintenanceRecommendation:
     work_order_template: Dict[str, Any]
 
 
+def _sensor_statistics(sensor_data: Dict[str, List[float]]) -> np.ndarray:
+    """Mean, std, max and min of each non-empty sensor, flattened in sensor order"""
+    
+    arrays = [np.asarray(readings, dtype=np.float64) for readings in sensor_data.values() if readings]
+    if not arrays:
+        return np.empty(0)
+    
+    if len({len(a) for a in arrays}) == 1:
+        # Equal-length sensors reduce as one (sensors, readings) matrix
+        matrix = np.vstack(arrays)
+        stats = np.column_stack([
+            matrix.mean(axis=1), matrix.std(axis=1), matrix.max(axis=1), matrix.min(axis=1)
+        ])
+    else:
+        stats = np.array([[a.mean(), a.std(), a.max(), a.min()] for a in arrays])
+    
+    return stats.ravel()
+
+
+def _aggregate_by_category(records: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[Any, float]]:
+    """Per-category cost mean/sum/count and duration mean, keyed like a pandas agg().to_dict()"""
+    
+    costs: Dict[Any, List[float]] = {}
+    durations: Dict[Any, List[float]] = {}
+    for m in records:
+        category = m.get("category")
+        if category is None:
+            continue
+        category_costs = costs.setdefault(category, [])
+        category_durations = durations.setdefault(category, [])
+        if m.get("cost") is not None:
+            category_costs.append(m["cost"])
+        if m.get("duration") is not None:
+            category_durations.append(m["duration"])
+    
+    result: Dict[Tuple[str, str], Dict[Any, float]] = {
+        ("cost", "mean"): {}, ("cost", "sum"): {}, ("cost", "count"): {}, ("duration", "mean"): {}
+    }
+    for category in sorted(costs):
+        values = costs[category]
+        result[("cost", "mean")][category] = float(np.mean(values)) if values else float("nan")
+        result[("cost", "sum")][category] = float(np.sum(values))
+        result[("cost", "count")][category] = len(values)
+        result[("duration", "mean")][category] = (
+            float(np.mean(durations[category])) if durations[category] else float("nan")
+        )
+    return result
+
+
+def serialize_report(report: Dict[str, Any]) -> bytes:
+    """JSON-encode a dashboard/portfolio report; numpy scalars and naive UTC datetimes are handled natively"""
+    return orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+
+
 class PredictiveMaintenanceAI:
     """AI system for predictive maintenance"""
     
+    # Feature vector width: 7 scalar features plus 4 statistics per sensor
+    MAX_SENSORS = 8
+    N_FEATURES = 7 + 4 * MAX_SENSORS
+    
+    # Concurrent RentVine requests allowed during portfolio fan-out
+    IO_CONCURRENCY = 32
+    
     def __init__(
         self,
         rentvine_client: RentVineAPIClient,
@@ -107,27 +314,46 @@ class PredictiveMaintenanceAI:
         self.metrics_collector = MetricsCollector()
         self.tracing = TracingManager()
         
-        # ML models
+        # ML models; sklearn is imported here to keep module import light
+        from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
+        
         self.failure_predictor = GradientBoostingClassifier(n_estimators=100, random_state=42)
-        self.rul_predictor = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.cost_estimator = RandomForestRegressor(n_estimators=50, random_state=42)
+        # Forests spread tree traversal across cores; gradient boosting predicts serially
+        self.rul_predictor = RandomForestRegressor(n_estimators=100, n_jobs=-1, random_state=42)
+        self.cost_estimator = RandomForestRegressor(n_estimators=50, n_jobs=-1, random_state=42)
         self.time_series_analyzer = TimeSeriesAnalyzer()
         self.pattern_recognizer = PatternRecognizer()
         
+        # (estimators_ compiled from, ONNX Runtime session), set by compile_onnx_predictors()
+        self._failure_sess: Optional[Tuple[Any, Any]] = None
+        self._rul_sess: Optional[Tuple[Any, Any]] = None
+        
         # Equipment profiles
         self.equipment_profiles: Dict[str, EquipmentProfile] = {}
+        # Dense equipment type -> feature code, persisted with the models
+        self.equipment_type_codes: Dict[str, int] = {}
         self.maintenance_history: List[Dict[str, Any]] = []
         self.predictions: List[MaintenancePrediction] = []
+        # Failure probabilities of self.predictions, grown by doubling
+        self._fp_buffer = np.empty(1024, dtype=np.float64)
+        self._fp_len = 0
         
         # Configuration
         self.prediction_horizon_days = 90
         self.emergency_threshold = 0.8
         self.high_urgency_threshold = 0.6
+        self.max_stored_predictions = 10_000
+        
+        # Bounds concurrent RentVine requests during portfolio fan-out; built inside the running
+        # loop by _io_semaphore, since on Python 3.9 a Semaphore binds the loop it is created under
+        self._io_sem: Optional[asyncio.Semaphore] = None
+        self._io_sem_loop: Optional[asyncio.AbstractEventLoop] = None
         
     async def analyze_equipment(
         self,
         equipment_id: str,
-        include_sensor_data: bool = True
+        include_sensor_data: bool = True,
+        now: Optional[datetime] = None
     ) -> MaintenancePrediction:
         """Analyze equipment and predict maintenance needs"""
         
@@ -137,28 +363,60 @@ class PredictiveMaintenanceAI:
             # Get equipment profile
             profile = await self._get_or_create_profile(equipment_id)
             
-            # Collect features
-            features = await self._extract_equipment_features(profile, include_sensor_data)
+            predictions = await self._analyze_profiles([profile], include_sensor_data, now)
+            return predictions[0]
             
-            # Make predictions
-            failure_prob = self._predict_failure_probability(features)
-            rul_days = self._predict_remaining_useful_life(features)
+        finally:
+            self.tracing.end_trace(trace_id)
+    
+    async def _analyze_profiles(
+        self,
+        profiles: List[EquipmentProfile],
+        include_sensor_data: bool = True,
+        now: Optional[datetime] = None
+    ) -> List[MaintenancePrediction]:
+        """Predict maintenance needs for a batch of equipment with one model call per predictor"""
+        
+        if not profiles:
+            return []
+        
+        # One timestamp for the whole batch; day-granularity ages don't need more
+        now = now or datetime.utcnow()
+        
+        # Collect features for the whole batch
+        feature_rows = [
+            await self._extract_equipment_features(profile, include_sensor_data, now)
+            for profile in profiles
+        ]
+        features_matrix = self._stack_features(feature_rows)
+        
+        # Make predictions
+        failure_probs = self._predict_failure_probabilities(features_matrix)
+        rul_days_batch = self._predict_remaining_useful_lives(features_matrix)
+        urgency_codes = self._determine_urgency_codes(failure_probs, rul_days_batch)
+        
+        predictions = []
+        for profile, features, failure_prob, rul_days, urgency_code in zip(
+            profiles, feature_rows, failure_probs, rul_days_batch, urgency_codes
+        ):
+            failure_prob = float(failure_prob)
+            rul_days = int(rul_days)
             
             # Determine urgency and action
-            urgency = self._determine_urgency(failure_prob, rul_days)
+            urgency = _URGENCY_BY_CODE[urgency_code]
             action = self._recommend_action(failure_prob, rul_days, urgency)
             
             # Estimate cost
             estimated_cost = await self._estimate_maintenance_cost(
-                profile, urgency, action
+                profile, urgency, action, now
             )
             
             # Identify risk factors
             risk_factors = self._identify_risk_factors(profile, features)
             
             prediction = MaintenancePrediction(
-                equipment_id=equipment_id,
-                prediction_date=datetime.utcnow(),
+                equipment_id=profile.equipment_id,
+                prediction_date=now,
                 failure_probability=failure_prob,
                 remaining_useful_life_days=rul_days,
                 recommended_action=action,
@@ -169,17 +427,16 @@ class PredictiveMaintenanceAI:
             )
             
             # Store prediction
-            self.predictions.append(prediction)
+            self._store_prediction(prediction)
             
             # Update profile
             profile.failure_risk_score = failure_prob
             if urgency in [MaintenanceUrgency.HIGH, MaintenanceUrgency.EMERGENCY]:
-                profile.next_maintenance_date = datetime.utcnow() + timedelta(days=7)
-            
-            return prediction
+                profile.next_maintenance_date = now + timedelta(days=7)
             
-        finally:
-            self.tracing.end_trace(trace_id)
+            predictions.append(prediction)
+        
+        return predictions
     
     async def analyze_property_portfolio(
         self,
@@ -187,8 +444,11 @@ class PredictiveMaintenanceAI:
     ) -> Dict[str, Any]:
         """Analyze maintenance needs across property portfolio"""
         
+        # Single snapshot threaded through the whole pass
+        now = datetime.utcnow()
+        
         portfolio_analysis = {
-            "timestamp": datetime.utcnow(),
+            "timestamp": now,
             "properties_analyzed": len(property_ids),
             "total_equipment": 0,
             "high_risk_equipment": [],
@@ -197,15 +457,15 @@ class PredictiveMaintenanceAI:
             "recommendations": []
         }
         
-        # Analyze each property
-        for property_id in property_ids:
-            property_equipment = await self._get_property_equipment(property_id)
+        # Analyze all properties concurrently
+        results = await asyncio.gather(*[
+            self._analyze_one_property(property_id, now) for property_id in property_ids
+        ])
+        
+        for property_id, property_equipment, predictions in results:
             portfolio_analysis["total_equipment"] += len(property_equipment)
             
-            # Analyze each equipment
-            for equipment in property_equipment:
-                prediction = await self.analyze_equipment(equipment["id"])
-                
+            for equipment, prediction in zip(property_equipment, predictions):
                 if prediction.failure_probability > self.high_urgency_threshold:
                     portfolio_analysis["high_risk_equipment"].append({
                         "equipment_id": equipment["id"],
@@ -236,6 +496,48 @@ class PredictiveMaintenanceAI:
         
         return portfolio_analysis
     
+    async def _analyze_one_property(
+        self,
+        property_id: str,
+        now: Optional[datetime] = None
+    ) -> Tuple[str, List[Dict[str, Any]], List[MaintenancePrediction]]:
+        """Fetch a property's equipment and score it in one batch"""
+        
+        async with self._io_semaphore():
+            property_equipment = await self._get_property_equipment(property_id)
+        
+        # Load all profiles, then score the property's equipment in one batch
+        profiles = await asyncio.gather(*[
+            self._get_or_create_profile(equipment["id"])
+            for equipment in property_equipment
+        ])
+        predictions = await self._analyze_profiles(list(profiles), now=now)
+        
+        return property_id, property_equipment, predictions
+    
+    def _store_prediction(self, prediction: MaintenancePrediction):
+        """Store a prediction, dropping the oldest half once the history limit is hit"""
+        
+        self.predictions.append(prediction)
+        self._record_failure_probability(prediction.failure_probability)
+        
+        if len(self.predictions) > self.max_stored_predictions:
+            drop = len(self.predictions) // 2
+            del self.predictions[:drop]
+            remaining = self._fp_len - drop
+            self._fp_buffer[:remaining] = self._fp_buffer[drop:self._fp_len]
+            self._fp_len = remaining
+    
+    def _record_failure_probability(self, failure_prob: float):
+        """Append to the failure probability buffer, doubling it when full"""
+        
+        if self._fp_len == self._fp_buffer.size:
+            grown = np.empty(self._fp_buffer.size * 2, dtype=self._fp_buffer.dtype)
+            grown[:self._fp_len] = self._fp_buffer
+            self._fp_buffer = grown
+        self._fp_buffer[self._fp_len] = failure_prob
+        self._fp_len += 1
+    
     async def predict_seasonal_maintenance(
         self,
         property_id: str,
@@ -322,9 +624,6 @@ class PredictiveMaintenanceAI:
         if not recent_maintenance:
             return {"error": "Insufficient maintenance history"}
         
-        # Convert to DataFrame for analysis
-        df = pd.DataFrame(recent_maintenance)
-        
         patterns = {
             "timestamp": datetime.utcnow(),
             "analysis_period": time_window.days,
@@ -333,32 +632,38 @@ class PredictiveMaintenanceAI:
         }
         
         # Analyze by category
-        if "category" in df.columns:
-            category_analysis = df.groupby("category").agg({
-                "cost": ["mean", "sum", "count"],
-                "duration": "mean"
-            })
-            patterns["patterns"]["by_category"] = category_analysis.to_dict()
-        
-        # Time series analysis
-        df["date"] = pd.to_datetime(df["date"])
-        df.set_index("date", inplace=True)
+        if any("category" in m for m in recent_maintenance):
+            patterns["patterns"]["by_category"] = _aggregate_by_category(recent_maintenance)
+        
+        # Bucket events into consecutive calendar months, empty months included
+        dated = [m for m in recent_maintenance if m.get("date") is not None]
+        months = np.array(
+            [m["date"] for m in dated], dtype="datetime64[us]"
+        ).astype("datetime64[M]").astype(np.int64)
+        month_idx = months - months.min() if len(months) else months
         
         # Monthly frequency analysis
-        monthly_counts = df.resample("M").size()
+        monthly_counts = np.bincount(month_idx)
         patterns["patterns"]["monthly_frequency"] = {
             "mean": monthly_counts.mean(),
-            "std": monthly_counts.std(),
+            "std": monthly_counts.std(ddof=1),
             "trend": self._detect_trend(monthly_counts)
         }
         
         # Failure pattern recognition
+        df = pd.DataFrame(recent_maintenance)
+        if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+            df["date"] = pd.to_datetime(df["date"], cache=True)
+        df.set_index("date", inplace=True)
         failure_patterns = await self.pattern_recognizer.analyze_failures(df)
         patterns["patterns"]["failure_patterns"] = failure_patterns
         
         # Cost trends
-        if "cost" in df.columns:
-            monthly_costs = df.resample("M")["cost"].sum()
+        if any("cost" in m for m in recent_maintenance):
+            costs = np.fromiter(
+                (m.get("cost") or 0 for m in dated), dtype=np.float64, count=len(dated)
+            )
+            monthly_costs = np.bincount(month_idx, weights=costs, minlength=len(monthly_counts))
             patterns["patterns"]["cost_trends"] = {
                 "monthly_average": monthly_costs.mean(),
                 "trend": self._detect_trend(monthly_costs),
@@ -378,6 +683,8 @@ class PredictiveMaintenanceAI:
         if not profile:
             raise ValueError(f"Equipment {prediction.equipment_id} not found")
         
+        now = datetime.utcnow()
+        
         # Create work order
         work_order = {
             "property_id": profile.property_id,
@@ -388,7 +695,7 @@ class PredictiveMaintenanceAI:
             "category": self._get_equipment_category(profile.equipment_type).value,
             "estimated_cost": prediction.estimated_cost,
             "ai_metadata": {
-                "prediction_id": f"pred_{datetime.utcnow().timestamp()}",
+                "prediction_id": f"pred_{now.timestamp()}",
                 "failure_probability": prediction.failure_probability,
                 "confidence_score": prediction.confidence_score,
                 "risk_factors": prediction.risk_factors,
@@ -411,7 +718,7 @@ class PredictiveMaintenanceAI:
             "work_order_id": created_order["id"],
             "equipment_id": prediction.equipment_id,
             "prediction": prediction,
-            "created_at": datetime.utcnow()
+            "created_at": now
         })
         
         return created_order
@@ -444,22 +751,31 @@ class PredictiveMaintenanceAI:
         }
         
         # Analyze each equipment
-        for equipment in equipment_list:
-            equipment_roi = await self._calculate_equipment_roi(
-                equipment, analysis_period_years
-            )
-            
-            # Aggregate costs
-            roi_analysis["predictive_maintenance"]["total_cost"] += equipment_roi["predictive_cost"]
-            roi_analysis["reactive_maintenance"]["total_cost"] += equipment_roi["reactive_cost"]
-            
-            # Count prevented failures
-            roi_analysis["predictive_maintenance"]["prevented_failures"] += equipment_roi["prevented_failures"]
-            roi_analysis["reactive_maintenance"]["failure_count"] += equipment_roi["expected_failures"]
+        equipment_rois = [
+            await self._calculate_equipment_roi(equipment, analysis_period_years)
+            for equipment in equipment_list
+        ]
+        
+        # Aggregate all ROI columns in one vectorized pass
+        if equipment_rois:
+            (
+                predictive_cost, reactive_cost, prevented_failures,
+                expected_failures, downtime_saved, reactive_downtime
+            ) = np.array([
+                [
+                    roi["predictive_cost"], roi["reactive_cost"], roi["prevented_failures"],
+                    roi["expected_failures"], roi["downtime_saved"], roi["reactive_downtime"]
+                ]
+                for roi in equipment_rois
+            ], dtype=np.float64).sum(axis=0).tolist()
             
-            # Calculate downtime
-            roi_analysis["predictive_maintenance"]["downtime_hours_saved"] += equipment_roi["downtime_saved"]
-            roi_analysis["reactive_maintenance"]["downtime_hours"] += equipment_roi["reactive_downtime"]
+            roi_analysis["predictive_maintenance"]["total_cost"] = predictive_cost
+            roi_analysis["reactive_maintenance"]["total_cost"] = reactive_cost
+            # Failure counts went through the float64 sum; report them as the integers they are
+            roi_analysis["predictive_maintenance"]["prevented_failures"] = int(round(prevented_failures))
+            roi_analysis["reactive_maintenance"]["failure_count"] = int(round(expected_failures))
+            roi_analysis["predictive_maintenance"]["downtime_hours_saved"] = downtime_saved
+            roi_analysis["reactive_maintenance"]["downtime_hours"] = reactive_downtime
         
         # Calculate ROI metrics
         total_savings = (
@@ -518,11 +834,11 @@ class PredictiveMaintenanceAI:
                 dashboard["overview"]["high_risk_count"] += 1
         
         # Get recent predictions
-        recent_predictions = sorted(
+        recent_predictions = heapq.nlargest(
+            10,
             self.predictions,
-            key=lambda p: p.prediction_date,
-            reverse=True
-        )[:10]
+            key=lambda p: p.prediction_date
+        )
         
         dashboard["overview"]["recent_predictions"] = [
             {
@@ -535,10 +851,8 @@ class PredictiveMaintenanceAI:
         ]
         
         # Calculate metrics
-        if self.predictions:
-            dashboard["metrics"]["average_failure_probability"] = np.mean([
-                p.failure_probability for p in self.predictions
-            ])
+        if self._fp_len:
+            dashboard["metrics"]["average_failure_probability"] = self._fp_buffer[:self._fp_len].mean()
         
         # Calculate prediction accuracy (if we have outcomes)
         accuracy = await self._calculate_prediction_accuracy()
@@ -562,6 +876,19 @@ class PredictiveMaintenanceAI:
         
         return dashboard
     
+    async def generate_maintenance_dashboard_json(self) -> bytes:
+        """Dashboard data serialized straight to JSON bytes"""
+        
+        return serialize_report(await self.generate_maintenance_dashboard())
+    
+    def _io_semaphore(self) -> asyncio.Semaphore:
+        """RentVine request semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._io_sem_loop is not loop:
+            self._io_sem = asyncio.Semaphore(self.IO_CONCURRENCY)
+            self._io_sem_loop = loop
+        return self._io_sem
+    
     async def _get_or_create_profile(self, equipment_id: str) -> EquipmentProfile:
         """Get or create equipment profile"""
         
@@ -569,7 +896,8 @@ class PredictiveMaintenanceAI:
             return self.equipment_profiles[equipment_id]
         
         # Fetch from RentVine
-        equipment_data = await self.rentvine_client.get_equipment(equipment_id)
+        async with self._io_semaphore():
+            equipment_data = await self.rentvine_client.get_equipment(equipment_id)
         
         profile = EquipmentProfile(
             equipment_id=equipment_id,
@@ -582,8 +910,10 @@ class PredictiveMaintenanceAI:
         )
         
         # Load maintenance history
-        history = await self.rentvine_client.get_maintenance_history(equipment_id)
-        profile.maintenance_history = history
+        async with self._io_semaphore():
+            history = await self.rentvine_client.get_maintenance_history(equipment_id)
+        profile.set_maintenance_history(history)
+        self._get_equipment_type_code(profile.equipment_type)
         
         self.equipment_profiles[equipment_id] = profile
         return profile
@@ -591,87 +921,175 @@ class PredictiveMaintenanceAI:
     async def _extract_equipment_features(
         self,
         profile: EquipmentProfile,
-        include_sensor_data: bool
+        include_sensor_data: bool,
+        now: Optional[datetime] = None
     ) -> np.ndarray:
         """Extract features for ML models"""
         
-        features = []
+        now = now or datetime.utcnow()
+        
+        # Features only change with a history update, sensor growth or the passing of a day;
+        # the key is compared as a tuple, so two different states can never collide
+        key = (
+            include_sensor_data,
+            profile._history_version,
+            tuple(len(readings) for readings in profile.sensor_data.values()),
+            now.toordinal()
+        )
+        if profile._feature_cache is not None and profile._feature_cache[0] == key:
+            return profile._feature_cache[1]
+        
+        # Fixed layout: 7 scalar slots, then mean/std/max/min per sensor (zero-padded)
+        feature_vector = np.zeros(self.N_FEATURES, dtype=np.float32)
         
         # Age features
-        age_days = (datetime.utcnow() - profile.install_date).days
+        age_days = (now - profile.install_date).days
         age_years = age_days / 365
-        features.extend([age_days, age_years])
+        feature_vector[0] = age_days
+        feature_vector[1] = age_years
         
         # Usage percentage of expected lifespan
-        lifespan_usage = age_years / profile.expected_lifespan_years
-        features.append(lifespan_usage)
+        feature_vector[2] = age_years / profile.expected_lifespan_years
         
         # Maintenance history features
-        maintenance_count = len(profile.maintenance_history)
         days_since_last_maintenance = 365  # Default
         
-        if profile.maintenance_history:
-            last_maintenance = max(
-                profile.maintenance_history,
-                key=lambda m: m.get("date", datetime.min)
-            )
+        last_maintenance = profile.latest_maintenance
+        if last_maintenance is not None:
             days_since_last_maintenance = (
-                datetime.utcnow() - datetime.fromisoformat(last_maintenance["date"])
+                now - last_maintenance["date"]
             ).days
         
-        features.extend([maintenance_count, days_since_last_maintenance])
+        feature_vector[3] = len(profile.maintenance_history)
+        feature_vector[4] = days_since_last_maintenance
         
         # Failure history
-        failure_count = sum(
+        feature_vector[5] = sum(
             1 for m in profile.maintenance_history
             if m.get("type") == "failure"
         )
-        features.append(failure_count)
         
-        # Sensor data features (if available)
+        # Equipment type encoding
+        feature_vector[6] = self._get_equipment_type_code(profile.equipment_type)
+        
+        # Sensor data features (if available), up to MAX_SENSORS sensors
         if include_sensor_data and profile.sensor_data:
-            for sensor_type, readings in profile.sensor_data.items():
-                if readings:
-                    features.extend([
-                        np.mean(readings),
-                        np.std(readings),
-                        np.max(readings),
-                        np.min(readings)
-                    ])
+            sensor_stats = _sensor_statistics(profile.sensor_data)[:4 * self.MAX_SENSORS]
+            feature_vector[7:7 + len(sensor_stats)] = sensor_stats
         
-        # Equipment type encoding (simplified)
-        equipment_type_code = hash(profile.equipment_type) % 100
-        features.append(equipment_type_code)
+        profile._feature_cache = (key, feature_vector)
+        return feature_vector
+    
+    @staticmethod
+    def _stack_features(feature_rows: List[np.ndarray]) -> np.ndarray:
+        """Stack fixed-width per-equipment feature vectors into an (N, N_FEATURES) matrix"""
         
-        return np.array(features)
+        return np.vstack(feature_rows)
+    
+    @property
+    def _failure_fitted(self) -> bool:
+        """Whether the failure predictor is trained, read from the estimator itself"""
+        return hasattr(self.failure_predictor, "classes_")
+    
+    @property
+    def _rul_fitted(self) -> bool:
+        """Whether the RUL predictor is trained, read from the estimator itself"""
+        return hasattr(self.rul_predictor, "estimators_")
+    
+    @staticmethod
+    def _current_session(compiled: Optional[Tuple[Any, Any]], estimator) -> Any:
+        """The compiled ONNX session, or None once the estimator has been refit since compiling"""
+        # fit() replaces estimators_, so identity tells a stale session apart
+        if compiled is None or compiled[0] is not getattr(estimator, "estimators_", None):
+            return None
+        return compiled[1]
+    
+    def train(
+        self,
+        features_matrix: np.ndarray,
+        failure_labels: np.ndarray,
+        rul_days: np.ndarray,
+        costs: Optional[np.ndarray] = None
+    ):
+        """Fit the predictors on an (N, N_FEATURES) matrix and drop ONNX sessions compiled from older fits"""
+        
+        self.failure_predictor.fit(features_matrix, failure_labels)
+        self.rul_predictor.fit(features_matrix, rul_days)
+        if costs is not None:
+            self.cost_estimator.fit(features_matrix, costs)
+        self._failure_sess = None
+        self._rul_sess = None
+    
+    def compile_onnx_predictors(self, n_features: int) -> bool:
+        """Export the fitted failure and RUL predictors to ONNX Runtime sessions.
+        
+        Call after training; sklearn stays in use for fitting, ONNX Runtime
+        serves predictions. Returns False when onnxruntime/skl2onnx are missing
+        or the models are not fitted.
+        """
+        
+        if not ONNX_AVAILABLE or not (self._failure_fitted and self._rul_fitted):
+            return False
+        
+        initial_types = [("input", FloatTensorType([None, n_features]))]
+        failure_onx = convert_sklearn(
+            self.failure_predictor,
+            initial_types=initial_types,
+            options={id(self.failure_predictor): {"zipmap": False}}
+        )
+        rul_onx = convert_sklearn(self.rul_predictor, initial_types=initial_types)
+        
+        self._failure_sess = (self.failure_predictor.estimators_, onnxruntime.InferenceSession(
+            failure_onx.SerializeToString(), providers=["CPUExecutionProvider"]
+        ))
+        self._rul_sess = (self.rul_predictor.estimators_, onnxruntime.InferenceSession(
+            rul_onx.SerializeToString(), providers=["CPUExecutionProvider"]
+        ))
+        return True
     
     def _predict_failure_probability(self, features: np.ndarray) -> float:
         """Predict probability of failure"""
         
-        try:
-            # Reshape for single prediction
-            features_2d = features.reshape(1, -1)
-            
-            # Get probability
-            prob = self.failure_predictor.predict_proba(features_2d)[0][1]
-            return float(prob)
-        except:
-            # Return default if model not trained
-            return 0.5
+        # Reshape for single prediction
+        return float(self._predict_failure_probabilities(features.reshape(1, -1))[0])
+    
+    def _predict_failure_probabilities(self, features_matrix: np.ndarray) -> np.ndarray:
+        """Predict probability of failure for each row of an (N, F) feature matrix"""
+        
+        if not self._failure_fitted:
+            # Default until the model is trained
+            return np.full(len(features_matrix), 0.5)
+        
+        session = self._current_session(self._failure_sess, self.failure_predictor)
+        if session is not None:
+            # Outputs are (labels, probabilities)
+            _, probabilities = session.run(
+                None, {"input": features_matrix.astype(np.float32, copy=False)}
+            )
+            return probabilities[:, 1].astype(np.float64)
+        return self.failure_predictor.predict_proba(features_matrix)[:, 1]
     
     def _predict_remaining_useful_life(self, features: np.ndarray) -> int:
         """Predict remaining useful life in days"""
         
-        try:
-            # Reshape for single prediction
-            features_2d = features.reshape(1, -1)
-            
-            # Get prediction
-            rul_days = self.rul_predictor.predict(features_2d)[0]
-            return max(0, int(rul_days))
-        except:
-            # Return default if model not trained
-            return 180  # 6 months default
+        # Reshape for single prediction
+        return int(self._predict_remaining_useful_lives(features.reshape(1, -1))[0])
+    
+    def _predict_remaining_useful_lives(self, features_matrix: np.ndarray) -> np.ndarray:
+        """Predict remaining useful life in days for each row of an (N, F) feature matrix"""
+        
+        if not self._rul_fitted:
+            # Default until the model is trained
+            return np.full(len(features_matrix), 180, dtype=int)  # 6 months default
+        
+        session = self._current_session(self._rul_sess, self.rul_predictor)
+        if session is not None:
+            rul_days = session.run(
+                None, {"input": features_matrix.astype(np.float32, copy=False)}
+            )[0].ravel()
+        else:
+            rul_days = self.rul_predictor.predict(features_matrix)
+        return np.maximum(0, rul_days.astype(int))
     
     def _determine_urgency(self, failure_prob: float, rul_days: int) -> MaintenanceUrgency:
         """Determine maintenance urgency"""
@@ -687,6 +1105,20 @@ class PredictiveMaintenanceAI:
         else:
             return MaintenanceUrgency.PREVENTIVE
     
+    def _determine_urgency_codes(self, failure_probs: np.ndarray, rul_days: np.ndarray) -> np.ndarray:
+        """Vectorized _determine_urgency; returns indexes into _URGENCY_BY_CODE"""
+        
+        return np.select(
+            [
+                (failure_probs > self.emergency_threshold) | (rul_days < 7),
+                (failure_probs > self.high_urgency_threshold) | (rul_days < 30),
+                (failure_probs > 0.4) | (rul_days < 90),
+                failure_probs > 0.2
+            ],
+            [0, 1, 2, 3],
+            default=4
+        )
+    
     def _recommend_action(
         self,
         failure_prob: float,
@@ -710,116 +1142,300 @@ class PredictiveMaintenanceAI:
         self,
         profile: EquipmentProfile,
         urgency: MaintenanceUrgency,
-        action: str
+        action: str,
+        now: Optional[datetime] = None
     ) -> float:
         """Estimate maintenance cost"""
         
         # Base cost by equipment type
-        base_costs = {
-            "hvac": 500,
-            "plumbing": 300,
-            "electrical": 400,
-            "appliances": 250,
-            "structural": 1000,
-            "landscaping": 150,
-            "general": 200
-        }
-        
         equipment_category = self._get_equipment_category(profile.equipment_type).value
-        base_cost = base_costs.get(equipment_category, 300)
+        base_cost = _BASE_COSTS.get(equipment_category, 300)
         
         # Urgency multiplier
-        urgency_multipliers = {
-            MaintenanceUrgency.EMERGENCY: 2.0,
-            MaintenanceUrgency.HIGH: 1.5,
-            MaintenanceUrgency.MEDIUM: 1.2,
-            MaintenanceUrgency.LOW: 1.0,
-            MaintenanceUrgency.PREVENTIVE: 0.8
-        }
-        
-        cost = base_cost * urgency_multipliers.get(urgency, 1.0)
+        cost = base_cost * _URGENCY_COST_MULTIPLIERS.get(urgency, 1.0)
         
         # Age factor
-        age_years = (datetime.utcnow() - profile.install_date).days / 365
+        age_years = ((now or datetime.utcnow()) - profile.install_date).days / 365
         if age_years > profile.expected_lifespan_years * 0.8:
             cost *= 1.3  # Older equipment costs more
         
         return round(cost, 2)
     
+    def _get_equipment_type_code(self, equipment_type: str) -> int:
+        """Stable dense integer code for an equipment type, assigned on first sight"""
+        
+        code = self.equipment_type_codes.get(equipment_type)
+        if code is None:
+            code = self.equipment_type_codes.setdefault(
+                equipment_type, len(self.equipment_type_codes)
+            )
+        return code
+    
+    def save_models(self, path: str):
+        """Persist the trained models together with the equipment type encoding"""
+        
+        joblib.dump({
+            "failure_predictor": self.failure_predictor,
+            "rul_predictor": self.rul_predictor,
+            "cost_estimator": self.cost_estimator,
+            "equipment_type_codes": self.equipment_type_codes
+        }, path)
+    
+    def load_models(self, path: str):
+        """Load models and the equipment type encoding saved by save_models()"""
+        
+        bundle = joblib.load(path)
+        self.failure_predictor = bundle["failure_predictor"]
+        self.rul_predictor = bundle["rul_predictor"]
+        self.cost_estimator = bundle["cost_estimator"]
+        self.equipment_type_codes = dict(bundle["equipment_type_codes"])
+        
+        # Sessions compiled from the previous models no longer apply
+        self._failure_sess = None
+        self._rul_sess = None
+    
     def _get_equipment_category(self, equipment_type: str) -> MaintenanceCategory:
         """Map equipment type to maintenance category"""
         
-        type_lower = equipment_type.lower()
-        
-        if any(term in type_lower for term in ["hvac", "ac", "heating", "cooling", "furnace"]):
-            return MaintenanceCategory.HVAC
-        elif any(term in type_lower for term in ["plumb", "pipe", "water", "drain"]):
-            return MaintenanceCategory.PLUMBING
-        elif any(term in type_lower for term in ["electric", "wire", "circuit", "outlet"]):
-            return MaintenanceCategory.ELECTRICAL
-        elif any(term in type_lower for term in ["appliance", "refrigerator", "washer", "dryer", "dishwasher"]):
-            return MaintenanceCategory.APPLIANCES
-        elif any(term in type_lower for term in ["struct", "roof", "foundation", "wall"]):
-            return MaintenanceCategory.STRUCTURAL
-        elif any(term in type_lower for term in ["landscape", "lawn", "garden", "irrigation"]):
-            return MaintenanceCategory.LANDSCAPING
-        elif any(term in type_lower for term in ["safety", "security", "fire", "alarm"]):
-            return MaintenanceCategory.SAFETY
-        else:
-            return MaintenanceCategory.GENERAL
+        return _equipment_category(equipment_type.lower())
     
     def _get_expected_lifespan(self, equipment_type: str) -> float:
         """Get expected lifespan in years for equipment type"""
         
-        lifespans = {
-            "hvac": 15,
-            "water_heater": 10,
-            "refrigerator": 13,
-            "washer": 10,
-            "dryer": 13,
-            "dishwasher": 9,
-            "roof": 20,
-            "plumbing": 50,
-            "electrical": 30
-        }
-        
-        type_lower = equipment_type.lower()
-        for key, years in lifespans.items():
-            if key in type_lower:
-                return years
-                
-        return 15  # Default 15 years
+        return _expected_lifespan(equipment_type.lower())
+
+
+def _njit(func):
+    """Compile a numeric kernel with numba, or return it unchanged without numba"""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+@_njit
+def _trend_slope(y):
+    """Closed-form least-squares slope of y against positions 0..n-1; NaN below two points"""
+    if y.shape[0] < 2:
+        return np.nan
+    x = np.arange(y.shape[0]) - (y.shape[0] - 1) / 2.0
+    return np.sum(x * (y - y.mean())) / np.sum(x * x)
+
+
+if NUMBA_AVAILABLE:
+    @numba.guvectorize(
+        [(numba.float32[:], numba.float64[:]), (numba.float64[:], numba.float64[:])],
+        "(n)->(n)",
+        nopython=True,
+        cache=True
+    )
+    def _zscores(y, out):
+        """Absolute sample z-score of each point, ignoring NaN padding; broadcasts over rows"""
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(y.shape[0]):
+            if not np.isnan(y[i]):
+                count += 1
+                delta = y[i] - mean
+                mean += delta / count
+                m2 += delta * (y[i] - mean)
+        std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        for i in range(y.shape[0]):
+            out[i] = abs(y[i] - mean) / std if std > 0.0 else np.nan
+else:
+    def _zscores(y):
+        """Absolute sample z-score of each point, ignoring NaN padding; broadcasts over rows"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nanmean(y, axis=-1, dtype=np.float64, keepdims=True)
+            std = np.nanstd(y, axis=-1, dtype=np.float64, ddof=1, keepdims=True)
+            return np.abs(y - mean) / std
+
+
+@_njit
+def _holt_forecast(y, periods, alpha, beta):
+    """Double exponential smoothing (Holt) forecast for the next periods steps"""
+    level = y[0]
+    trend = y[1] - y[0]
+    for i in range(1, y.shape[0]):
+        previous_level = level
+        level = alpha * y[i] + (1.0 - alpha) * (level + trend)
+        trend = beta * (level - previous_level) + (1.0 - beta) * trend
+    return level + trend * np.arange(1, periods + 1)
+
+
+def _classify_trend(slope: float) -> str:
+    """Map a fitted linear slope to a trend label"""
+    if abs(slope) < 0.01:
+        return "stable"
+    elif slope > 0:
+        return "increasing"
+    else:
+        return "decreasing"
+
+
+def _padded_stats(values: np.ndarray, lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row mean, sample std and least-squares slope of a NaN-padded float32 matrix"""
+    # Accumulate in float64 while the matrix itself stays float32
+    means = np.nanmean(values, axis=1, dtype=np.float64)
+    stds = np.nanstd(values, axis=1, dtype=np.float64, ddof=1)
+    deviations = values - means.astype(np.float32)[:, None]
+    
+    # Least-squares slope against positions 0..n-1, same as a degree-1 polyfit;
+    # the centered positions sum to n(n^2 - 1)/12 when squared
+    valid = np.arange(values.shape[1]) < lengths[:, None]
+    centers = ((lengths - 1) / 2.0).astype(np.float32)
+    x_centered = np.where(valid, np.arange(values.shape[1], dtype=np.float32) - centers[:, None], np.float32(0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = np.nansum(x_centered * deviations, axis=1, dtype=np.float64) / (lengths * (lengths ** 2 - 1) / 12.0)
+    return means, stds, slopes
+
+
+@_njit
+def _fused_stats(values, lengths):
+    """Welford single pass per row for mean, sample std and least-squares slope"""
+    n_rows = values.shape[0]
+    means = np.empty(n_rows)
+    stds = np.empty(n_rows)
+    slopes = np.empty(n_rows)
+    for row in range(n_rows):
+        n = lengths[row]
+        mean = 0.0
+        m2 = 0.0
+        co_moment = 0.0
+        for i in range(n):
+            y = np.float64(values[row, i])
+            delta = y - mean
+            mean += delta / (i + 1)
+            m2 += delta * (y - mean)
+            # Position i sits (i + 1)/2 above the mean of positions 0..i-1
+            co_moment += (i + 1) / 2.0 * (y - mean)
+        means[row] = mean
+        # Sample std and slope are undefined for a single reading, as in pandas
+        if n < 2:
+            stds[row] = np.nan
+            slopes[row] = np.nan
+        else:
+            stds[row] = np.sqrt(m2 / (n - 1))
+            slopes[row] = co_moment / (n * (n * n - 1) / 12.0)
+    return means, stds, slopes
+
+
+# The compiled kernel streams each row once; the NumPy version is the fast path without numba
+_row_stats = _fused_stats if NUMBA_AVAILABLE else _padded_stats
+
+
+def _reading_count(readings) -> int:
+    """Number of readings in either sensor input layout"""
+    return len(readings[1]) if _is_columnar(readings) else len(readings)
+
+
+def _is_columnar(readings) -> bool:
+    """True for a (timestamps, values) pair of arrays"""
+    return isinstance(readings, tuple) and len(readings) == 2 and isinstance(readings[1], np.ndarray)
+
+
+def _sensor_columns(readings) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """Normalize sensor readings to a (DatetimeIndex, values) pair"""
+    if _is_columnar(readings):
+        dates, values = readings
+        return pd.DatetimeIndex(dates), values
+    # Legacy list of (timestamp, value) tuples
+    dates, values = zip(*readings)
+    if getattr(dates[0], "tzinfo", None) is None:
+        # Naive datetimes convert with a straight buffer fill instead of pandas' per-element parser
+        dates = np.fromiter(dates, dtype="datetime64[us]", count=len(dates))
+    return pd.DatetimeIndex(dates), np.asarray(values, dtype=np.float32)
 
 
 class TimeSeriesAnalyzer:
     """Analyzes time series data for maintenance prediction"""
     
-    def __init__(self):
-        self.models = {}
+    # Cached ARIMA coefficients are refit once residual variance grows past this ratio
+    ARIMA_REFIT_VARIANCE_RATIO = 2.0
+    
+    # Shorter series are extrapolated linearly instead of fitting a forecaster
+    MIN_MODEL_FORECAST_POINTS = 20
+    
+    # Smoothing factors for the default Holt forecaster
+    HOLT_ALPHA = 0.3
+    HOLT_BETA = 0.1
+    
+    # Fan ARIMA forecasts out across threads once this many sensors need one
+    PARALLEL_FORECAST_MIN_SENSORS = 4
+    
+    def __init__(self, use_arima: bool = False):
+        # ARIMA fits keyed by (equipment id, sensor type); the analyzer is shared across equipment
+        self.models: Dict[Tuple[Optional[str], str], Dict[str, Any]] = {}
+        self.use_arima = use_arima
+        # (equipment id, sensor type) -> series length at the failed ARIMA fit; the mean forecast
+        # is used until the series grows or shrinks, then the fit is retried
+        self._unfittable: Dict[Tuple[Optional[str], str], int] = {}
         
     def analyze_sensor_data(
         self,
-        sensor_data: Dict[str, List[Tuple[datetime, float]]]
+        sensor_data: Dict[str, Union[Tuple[np.ndarray, np.ndarray], List[Tuple[datetime, float]]]],
+        equipment_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Analyze sensor time series data"""
+        """Analyze one equipment's sensor time series, given as (timestamps, values) arrays per sensor"""
         
-        analysis = {}
+        eligible = [
+            (sensor_type, _sensor_columns(readings)) for sensor_type, readings in sensor_data.items()
+            if _reading_count(readings) >= 10
+        ]
+        if not eligible:
+            return {}
+        
+        # Pad every sensor into one NaN-filled float32 matrix so the statistics run as row
+        # reductions; readings carry far fewer significant digits than float32 holds
+        lengths = np.fromiter((len(readings) for _, (_, readings) in eligible), dtype=np.intp, count=len(eligible))
+        max_len = int(lengths.max())
+        values = np.full((len(eligible), max_len), np.nan, dtype=np.float32)
+        indexes = []
+        for row, (_, (dates, readings_values)) in enumerate(eligible):
+            values[row, :lengths[row]] = readings_values
+            indexes.append(dates)
+        
+        means, stds, slopes = _row_stats(values, lengths)
+        
+        # Z-score every sensor at once; padding is NaN so it never flags
+        anomaly_rows, anomaly_cols = np.nonzero(_zscores(values) > 3)
+        anomaly_positions = np.split(anomaly_cols, np.searchsorted(anomaly_rows, np.arange(1, len(eligible))))
+        
+        # Series too short for a model get the fitted line extended, all sensors in one broadcast
+        periods = 7
+        line_forecasts = means[:, None] + slopes[:, None] * (
+            (lengths[:, None] - 1) / 2.0 + np.arange(1, periods + 1)
+        )
+        forecasts = line_forecasts.tolist()
+        
+        model_rows = np.flatnonzero(lengths >= self.MIN_MODEL_FORECAST_POINTS)
+        if not self.use_arima:
+            # Holt only needs the raw values, so no per-sensor Series is built
+            for row in model_rows:
+                forecasts[row] = self._holt_forecast(values[row, :lengths[row]], periods)
+        elif len(model_rows):
+            forecast_args = [
+                (pd.Series(values[row, :lengths[row]], index=indexes[row]), periods, (equipment_id, eligible[row][0]))
+                for row in model_rows
+            ]
+            if len(forecast_args) >= self.PARALLEL_FORECAST_MIN_SENSORS:
+                # ARIMA fits dominate here and sensors are independent; threads share the fit cache
+                model_forecasts = joblib.Parallel(n_jobs=-1, prefer="threads")(
+                    joblib.delayed(self._forecast_series)(*args) for args in forecast_args
+                )
+            else:
+                model_forecasts = [self._forecast_series(*args) for args in forecast_args]
+            for row, forecast in zip(model_rows, model_forecasts):
+                forecasts[row] = forecast
         
-        for sensor_type, readings in sensor_data.items():
-            if len(readings) < 10:
-                continue
-                
-            # Convert to pandas series
-            dates, values = zip(*readings)
-            ts = pd.Series(values, index=pd.DatetimeIndex(dates))
-            
-            # Basic statistics
+        analysis = {}
+        for row, (sensor_type, _) in enumerate(eligible):
             analysis[sensor_type] = {
-                "mean": ts.mean(),
-                "std": ts.std(),
-                "trend": self._detect_trend(ts),
-                "anomalies": self._detect_anomalies(ts),
-                "forecast": self._forecast_series(ts, periods=7)
+                "mean": means[row],
+                "std": stds[row],
+                "trend": _classify_trend(slopes[row]),
+                "anomalies": indexes[row].take(anomaly_positions[row]).tolist(),
+                "forecast": forecasts[row]
             }
             
         return analysis
@@ -831,42 +1447,83 @@ class TimeSeriesAnalyzer:
             return "insufficient_data"
             
         # Simple linear regression trend
-        x = np.arange(len(series))
-        y = series.values
-        
-        slope = np.polyfit(x, y, 1)[0]
+        slope = _trend_slope(series.to_numpy(dtype=np.float64))
         
-        if abs(slope) < 0.01:
-            return "stable"
-        elif slope > 0:
-            return "increasing"
-        else:
-            return "decreasing"
+        return _classify_trend(slope)
     
     def _detect_anomalies(self, series: pd.Series) -> List[datetime]:
         """Detect anomalies in time series"""
         
         # Simple z-score method
-        z_scores = np.abs((series - series.mean()) / series.std())
-        anomaly_indices = series.index[z_scores > 3].tolist()
+        z_scores = _zscores(series.to_numpy(dtype=np.float64))
+        anomaly_indices = series.index.take(np.flatnonzero(z_scores > 3)).tolist()
         
         return anomaly_indices
     
-    def _forecast_series(self, series: pd.Series, periods: int) -> List[float]:
+    def _holt_forecast(self, values: np.ndarray, periods: int) -> List[float]:
+        """Holt forecast of a raw value array"""
+        return _holt_forecast(
+            values.astype(np.float64, copy=False), periods, self.HOLT_ALPHA, self.HOLT_BETA
+        ).tolist()
+    
+    def _forecast_series(
+        self,
+        series: pd.Series,
+        periods: int,
+        key: Optional[Tuple[Optional[str], str]] = None
+    ) -> List[float]:
         """Forecast future values"""
         
-        if len(series) < 20:
+        # Sensor values are stored as float32; forecast in full precision
+        if series.dtype != np.float64:
+            series = series.astype(np.float64)
+        
+        if len(series) < self.MIN_MODEL_FORECAST_POINTS:
             # Too short for complex models, use simple average
             return [series.mean()] * periods
+        
+        if not self.use_arima:
+            return self._holt_forecast(series.to_numpy(), periods)
+        
+        if key is not None and key in self._unfittable:
+            if self._unfittable[key] == len(series):
+                return [series.mean()] * periods
+            del self._unfittable[key]
             
         try:
             # Use ARIMA for forecasting
-            model = ARIMA(series, order=(1, 1, 1))
-            model_fit = model.fit()
-            forecast = model_fit.forecast(steps=periods)
-            return forecast.tolist()
-        except:
-            # Fallback to simple method
+            from statsmodels.tsa.arima.model import ARIMA
+            from statsmodels.tools.sm_exceptions import MissingDataError
+        except ImportError:
+            return [series.mean()] * periods
+            
+        try:
+            digest = hash(series.to_numpy(dtype=np.float64).tobytes())
+            cached = self.models.get(key) if key is not None else None
+            if cached is not None and cached["digest"] == digest and cached["periods"] == periods:
+                return list(cached["forecast"])
+            
+            model_fit = None
+            if cached is not None:
+                # Kalman pass with the cached coefficients; refit only if the residuals drift
+                applied = cached["fit"].apply(series, refit=False)
+                if np.var(applied.resid[1:]) <= self.ARIMA_REFIT_VARIANCE_RATIO * cached["resid_var"]:
+                    model_fit = applied
+            
+            if model_fit is None:
+                model_fit = ARIMA(series, order=(1, 1, 1)).fit()
+                cached = {"fit": model_fit, "resid_var": float(np.var(model_fit.resid[1:]))}
+                
+            forecast = model_fit.forecast(steps=periods).tolist()
+            if key is not None:
+                cached.update(digest=digest, periods=periods, forecast=forecast)
+                self.models[key] = cached
+            return forecast
+        except (np.linalg.LinAlgError, ValueError, MissingDataError) as e:
+            # Fallback to simple method; not retried until this series changes length
+            if key is not None:
+                self._unfittable[key] = len(series)
+            logger.warning(f"ARIMA fit failed for sensor {key}, using mean forecast: {e}")
             return [series.mean()] * periods
 
 
@@ -875,6 +1532,17 @@ class PatternRecognizer:
     
     def __init__(self):
         self.patterns = []
+        # (index, month numbers) of the last frame analyzed
+        self._month_cache: Tuple[Optional[pd.Index], Optional[np.ndarray]] = (None, None)
+        
+    def _index_months(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """Month numbers of index, reused while the same index object is analyzed"""
+        cached_index, months = self._month_cache
+        # Index objects are immutable, so identity means the months are still valid
+        if cached_index is not index:
+            months = index.month.to_numpy()
+            self._month_cache = (index, months)
+        return months
         
     async def analyze_failures(self, maintenance_df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze failure patterns"""
@@ -887,31 +1555,29 @@ class PatternRecognizer:
         
         # Find recurring failures
         if "equipment_id" in maintenance_df.columns and "type" in maintenance_df.columns:
-            failure_df = maintenance_df[maintenance_df["type"] == "failure"]
-            
-            equipment_failures = failure_df.groupby("equipment_id").size()
-            recurring = equipment_failures[equipment_failures > 2]
+            type_counts = maintenance_df.groupby(["equipment_id", "type"]).size()
             
-            patterns["recurring_failures"] = [
-                {
-                    "equipment_id": eq_id,
-                    "failure_count": count,
-                    "pattern": "frequent_failures"
-                }
-                for eq_id, count in recurring.items()
-            ]
+            if "failure" in type_counts.index.get_level_values("type"):
+                equipment_failures = type_counts.xs("failure", level="type")
+                recurring = equipment_failures[equipment_failures > 2]
+                
+                patterns["recurring_failures"] = (
+                    recurring.rename("failure_count")
+                    .reset_index()
+                    .assign(pattern="frequent_failures")
+                    .to_dict("records")
+                )
         
         # Detect seasonal patterns
         if not maintenance_df.empty:
-            maintenance_df["month"] = maintenance_df.index.month
-            monthly_counts = maintenance_df.groupby("month").size()
+            monthly_counts = np.bincount(self._index_months(maintenance_df.index), minlength=13)[1:]
             
-            # Identify peak months
-            mean_count = monthly_counts.mean()
-            peak_months = monthly_counts[monthly_counts > mean_count * 1.5]
+            # Identify peak months, averaging only over months that have records
+            mean_count = monthly_counts[monthly_counts > 0].mean()
+            peak_months = np.flatnonzero(monthly_counts > mean_count * 1.5) + 1
             
             patterns["seasonal_patterns"] = {
-                "peak_months": peak_months.index.tolist(),
+                "peak_months": peak_months.tolist(),
                 "pattern": "seasonal_increase"
             }
         
@@ -4,20 +4,91 @@ Comprehensive monitoring, metrics, and alerting for Aictive Platform
 """
 
 import asyncio
+import atexit
+import bisect
+import heapq
+import os
+import sys
 import time
 import json
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+import operator
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Callable, Set, Tuple
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field, fields
 from enum import Enum
-import psutil
-import httpx
-from prometheus_client import Counter, Histogram, Gauge, Summary, CollectorRegistry, generate_latest
+import orjson
 import structlog
 
-# Configure structured logging
-logger = structlog.get_logger()
+# psutil, httpx and prometheus_client are imported where used, so importing this module
+# for its dataclasses and enums stays cheap
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
+
+class _LogSink:
+    """structlog logger writing rendered lines into a 64KB buffer; flushed periodically and on every warning or error"""
+    
+    BUFFER_SIZE = 64 * 1024
+    
+    def __init__(self):
+        self._file = None
+        self._opened = False
+    
+    def open(self):
+        """Open AICTIVE_MONITORING_LOG when it is set, otherwise log to stdout; a no-op once open"""
+        if self._opened:
+            return
+        self._opened = True
+        path = os.getenv("AICTIVE_MONITORING_LOG")
+        if path:
+            try:
+                self._file = open(path, "ab", buffering=self.BUFFER_SIZE)
+            except OSError:
+                pass
+        atexit.register(self.flush)
+    
+    def _stream(self):
+        """The log file, or whatever sys.stdout is at the time of the write"""
+        if not self._opened:
+            self.open()
+        # stdout is looked up per write rather than cached, so a redirected sys.stdout is honoured
+        return self._file if self._file is not None else sys.stdout.buffer
+    
+    def msg(self, message: bytes):
+        """Buffer one rendered record; the sink is opened on first use, not at import"""
+        self._stream().write(message + b"\n")
+    
+    log = debug = info = msg
+    
+    def error(self, message: bytes):
+        """Write a warning or error record and flush at once, so it survives a crash right after"""
+        self.msg(message)
+        self.flush()
+    
+    warn = warning = critical = exception = fatal = failure = err = error
+    
+    def flush(self):
+        """Push buffered records to the file or stdout"""
+        if self._opened:
+            self._stream().flush()
+
+
+_log_sink = _LogSink()
+
+# Configure structured logging; records render straight to bytes and are batched by the sink's buffer
+logger = structlog.wrap_logger(
+    _log_sink,
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps)
+    ],
+    cache_logger_on_first_use=True
+)
 
 
 class HealthStatus(Enum):
@@ -35,6 +106,24 @@ class MetricType(Enum):
     SUMMARY = "summary"
 
 
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """Render an epoch-nanosecond timestamp as UTC ISO 8601"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__; dataclass(slots=True) needs Python 3.10+"""
+    # Defaults live in the generated __init__, so the class attributes can give way to slots
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class HealthCheckResult:
     """Result of a health check"""
@@ -43,9 +132,10 @@ class HealthCheckResult:
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
     duration_ms: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: int = field(default_factory=time.time_ns)  # Unix epoch nanoseconds
 
 
+@_slotted
 @dataclass
 class Alert:
     """Alert configuration"""
@@ -58,15 +148,57 @@ class Alert:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Path segments that identify a record (numbers, prefixed ids like prop_123, UUIDs, hex ids)
+_ROUTE_ID_SEGMENT = re.compile(r"/(?:\d+|[A-Za-z]+_\d+|[0-9a-fA-F-]{32,36}|[0-9a-f]{8,})(?=/|$)")
+_KNOWN_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"})
+
+
+@lru_cache(maxsize=4096)
+def _normalize_endpoint(endpoint: str) -> str:
+    """Collapse id segments to :id so the endpoint label stays bounded by the route set"""
+    return _ROUTE_ID_SEGMENT.sub("/:id", endpoint)
+
+
+class _FamilyView:
+    """Registry stand-in exposing one metric family, so the stock encoder can format it alone"""
+    __slots__ = ("family",)
+    
+    def __init__(self):
+        self.family = None
+    
+    def collect(self):
+        return (self.family,)
+
+
 class MetricsCollector:
     """Prometheus metrics collector"""
     
-    def __init__(self, registry: Optional[CollectorRegistry] = None):
+    # Confidence above each threshold moves up one level; bisect_left keeps the bounds exclusive
+    _CONF_THRESHOLDS = (0.5, 0.8)
+    _CONF_LABELS = ("low", "medium", "high")
+    
+    STREAM_CHUNK_BYTES = 16 * 1024
+    VACANCY_TOP_K = 10
+    
+    def __init__(self, registry: Optional["CollectorRegistry"] = None):
+        from prometheus_client import CollectorRegistry
+        
         self.registry = registry or CollectorRegistry()
+        # decision_type -> ai_decisions_total children in _CONF_LABELS order
+        self._ai_decision_children: Dict[str, Tuple[Any, ...]] = {}
+        # (metric, label values) -> bound child, so hot paths skip .labels() parsing
+        self._children: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+        # property_ids currently exported by vacancy_rate_top
+        self._vacancy_top_ids: Set[str] = set()
+        # (monotonic time, payload) of the last rendered exposition
+        self._cached_metrics: Optional[Tuple[float, bytes]] = None
+        self._cache_ttl = 1.0
         self._initialize_metrics()
     
     def _initialize_metrics(self):
         """Initialize all metrics"""
+        from prometheus_client import Counter, Histogram, Gauge
+        
         # API metrics
         self.api_requests_total = Counter(
             'aictive_api_requests_total',
@@ -136,9 +268,30 @@ class MetricsCollector:
             registry=self.registry
         )
         
-        self.vacancy_rate = Gauge(
+        # Vacancy is aggregated across properties; a property_id label grows one series per property
+        self.vacancy_rate_distribution = Histogram(
             'aictive_vacancy_rate',
-            'Current vacancy rate',
+            'Vacancy rate distribution across properties',
+            buckets=(0.02, 0.05, 0.1, 0.15, 0.2, 0.3),
+            registry=self.registry
+        )
+        
+        self.vacancy_rate_avg = Gauge(
+            'aictive_vacancy_rate_avg',
+            'Average vacancy rate across properties',
+            registry=self.registry
+        )
+        
+        self.vacancy_rate_max = Gauge(
+            'aictive_vacancy_rate_max',
+            'Highest vacancy rate across properties',
+            registry=self.registry
+        )
+        
+        # Only the worst VACANCY_TOP_K properties get their own series, for outlier drill-down
+        self.vacancy_rate_top = Gauge(
+            'aictive_vacancy_rate_top',
+            'Vacancy rate of the properties with the highest vacancy',
             ['property_id'],
             registry=self.registry
         )
@@ -146,7 +299,7 @@ class MetricsCollector:
         self.revenue_collected = Counter(
             'aictive_revenue_collected_total',
             'Total revenue collected',
-            ['type', 'property_id'],
+            ['type'],
             registry=self.registry
         )
         
@@ -173,23 +326,31 @@ class MetricsCollector:
             registry=self.registry
         )
     
+    def _child(self, metric, *label_values: str):
+        """Child of metric for label values in declaration order, bound once and reused"""
+        key = (metric, label_values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*label_values)
+        return child
+    
     def record_api_request(self, method: str, endpoint: str, status: int, duration: float):
         """Record API request metrics"""
-        self.api_requests_total.labels(method=method, endpoint=endpoint, status=str(status)).inc()
-        self.api_request_duration.labels(method=method, endpoint=endpoint).observe(duration)
+        method = method.upper()
+        if method not in _KNOWN_METHODS:
+            method = "OTHER"
+        endpoint = _normalize_endpoint(endpoint)
+        self._child(self.api_requests_total, method, endpoint, str(status)).inc()
+        self._child(self.api_request_duration, method, endpoint).observe(duration)
     
     def record_workflow_execution(self, workflow_type: str, status: str, duration: float):
         """Record workflow execution metrics"""
-        self.workflow_executions_total.labels(workflow_type=workflow_type, status=status).inc()
-        self.workflow_duration.labels(workflow_type=workflow_type).observe(duration)
+        self._child(self.workflow_executions_total, workflow_type, status).inc()
+        self._child(self.workflow_duration, workflow_type).observe(duration)
     
     def record_workflow_step(self, workflow_type: str, step_name: str, status: str):
         """Record workflow step completion"""
-        self.workflow_steps_completed.labels(
-            workflow_type=workflow_type,
-            step_name=step_name,
-            status=status
-        ).inc()
+        self._child(self.workflow_steps_completed, workflow_type, step_name, status).inc()
     
     def update_business_metrics(self, metrics: Dict[str, Any]):
         """Update business metrics"""
@@ -203,32 +364,135 @@ class MetricsCollector:
                     self.work_orders_total.labels(status=status, priority=priority).set(count)
         
         if "vacancy_rates" in metrics:
-            for property_id, rate in metrics["vacancy_rates"].items():
-                self.vacancy_rate.labels(property_id=property_id).set(rate)
+            vacancy_rates = metrics["vacancy_rates"]
+            if vacancy_rates:
+                # The property rides along as an exemplar rather than a label
+                for property_id, rate in vacancy_rates.items():
+                    self.vacancy_rate_distribution.observe(rate, exemplar={"property_id": str(property_id)})
+                self.vacancy_rate_avg.set(sum(vacancy_rates.values()) / len(vacancy_rates))
+                self.vacancy_rate_max.set(max(vacancy_rates.values()))
+                
+                top = heapq.nlargest(self.VACANCY_TOP_K, vacancy_rates.items(), key=lambda item: item[1])
+                top_ids = {str(property_id) for property_id, _ in top}
+                for property_id in self._vacancy_top_ids - top_ids:
+                    self.vacancy_rate_top.remove(property_id)
+                for property_id, rate in top:
+                    self.vacancy_rate_top.labels(property_id=str(property_id)).set(rate)
+                self._vacancy_top_ids = top_ids
     
     def record_ai_decision(self, decision_type: str, confidence: float):
         """Record AI decision metrics"""
-        confidence_level = "high" if confidence > 0.8 else "medium" if confidence > 0.5 else "low"
-        self.ai_decisions_total.labels(
-            decision_type=decision_type,
-            confidence_level=confidence_level
-        ).inc()
+        children = self._ai_decision_children.get(decision_type)
+        if children is None:
+            children = self._ai_decision_children[decision_type] = tuple(
+                self.ai_decisions_total.labels(decision_type=decision_type, confidence_level=level)
+                for level in self._CONF_LABELS
+            )
+        children[bisect.bisect_left(self._CONF_THRESHOLDS, confidence)].inc()
     
     def record_error(self, error_type: str, component: str):
         """Record error metrics"""
-        self.errors_total.labels(error_type=error_type, component=component).inc()
+        self._child(self.errors_total, error_type, component).inc()
     
     def get_metrics(self) -> bytes:
         """Get metrics in Prometheus format"""
-        return generate_latest(self.registry)
+        # Scrapes within the TTL share one rendering of the registry
+        now = time.monotonic()
+        if self._cached_metrics and now - self._cached_metrics[0] < self._cache_ttl:
+            return self._cached_metrics[1]
+        
+        from prometheus_client import generate_latest
+        
+        payload = generate_latest(self.registry)
+        self._cached_metrics = (now, payload)
+        return payload
+    
+    async def stream_metrics(self, send: Callable):
+        """Stream metrics in Prometheus format as ASGI body messages after http.response.start"""
+        from prometheus_client import generate_latest
+        
+        # Encode one family at a time into a reused buffer instead of rendering the whole registry
+        view = _FamilyView()
+        chunk = bytearray()
+        for family in self.registry.collect():
+            view.family = family
+            chunk += generate_latest(view)
+            if len(chunk) >= self.STREAM_CHUNK_BYTES:
+                await send({"type": "http.response.body", "body": bytes(chunk), "more_body": True})
+                chunk.clear()
+        await send({"type": "http.response.body", "body": bytes(chunk), "more_body": False})
+
+
+class _SystemSampler:
+    """Memory and disk usage read from /proc/meminfo and statvfs, cached per interval"""
+    
+    MIN_INTERVAL = 1.0
+    
+    def __init__(self, path: str = "/"):
+        self.path = path
+        self._memory: Tuple[float, float, int] = (float("-inf"), 0.0, 0)
+        self._disk: Tuple[float, float, int] = (float("-inf"), 0.0, 0)
+    
+    @staticmethod
+    def _read_memory() -> Tuple[float, int]:
+        """(percent used, bytes available), the same figures psutil.virtual_memory reports"""
+        try:
+            with open("/proc/meminfo", "rb") as f:
+                meminfo = f.read()
+        except OSError:
+            import psutil
+            memory = psutil.virtual_memory()
+            return memory.percent, memory.available
+        values = {}
+        for line in meminfo.splitlines():
+            key, _, rest = line.partition(b":")
+            if key in (b"MemTotal", b"MemAvailable"):
+                values[key] = int(rest.split()[0]) * 1024
+                if len(values) == 2:
+                    break
+        total, available = values[b"MemTotal"], values[b"MemAvailable"]
+        return (total - available) / total * 100, available
+    
+    def _read_disk(self) -> Tuple[float, int]:
+        """(percent used, bytes free to unprivileged users), as psutil.disk_usage computes them"""
+        st = os.statvfs(self.path)
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        total_user = used + free
+        return (used / total_user * 100 if total_user else 0.0), free
+    
+    def memory(self) -> Tuple[float, int]:
+        """Cached memory usage, re-read at most once per MIN_INTERVAL"""
+        now = time.monotonic()
+        if now - self._memory[0] >= self.MIN_INTERVAL:
+            self._memory = (now, *self._read_memory())
+        return self._memory[1], self._memory[2]
+    
+    def disk(self) -> Tuple[float, int]:
+        """Cached disk usage, re-read at most once per MIN_INTERVAL"""
+        now = time.monotonic()
+        if now - self._disk[0] >= self.MIN_INTERVAL:
+            self._disk = (now, *self._read_disk())
+        return self._disk[1], self._disk[2]
 
 
 class HealthChecker:
     """Comprehensive health checking system"""
     
+    DEFAULT_CHECK_TIMEOUT = 5.0
+    
     def __init__(self, metrics_collector: MetricsCollector):
         self.metrics = metrics_collector
         self.checks: Dict[str, Callable] = {}
+        self._timeouts: Dict[str, float] = {}
+        self.system = _SystemSampler()
+        import httpx
+        import psutil
+        
+        # One pooled client for every API probe instead of a new connection per check
+        self._http = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_keepalive_connections=10))
+        # Prime psutil so later interval=None reads return the usage since the previous call
+        psutil.cpu_percent(interval=None)
         self._register_default_checks()
     
     def _register_default_checks(self):
@@ -239,24 +503,27 @@ class HealthChecker:
         self.register_check("redis", self._check_redis)
         self.register_check("rentvine", self._check_rentvine)
     
-    def register_check(self, name: str, check_func: Callable):
+    def register_check(self, name: str, check_func: Callable, timeout: Optional[float] = None):
         """Register a health check"""
         self.checks[name] = check_func
+        self._timeouts[name] = timeout or self.DEFAULT_CHECK_TIMEOUT
     
     async def _check_system_resources(self) -> HealthCheckResult:
         """Check system resources"""
         start_time = time.time()
         
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            import psutil
+            
+            cpu_percent = psutil.cpu_percent(interval=None)
+            memory_percent, memory_available = self.system.memory()
+            disk_percent, disk_free = self.system.disk()
             
             # Determine health status
-            if cpu_percent > 90 or memory.percent > 90 or disk.percent > 90:
+            if cpu_percent > 90 or memory_percent > 90 or disk_percent > 90:
                 status = HealthStatus.UNHEALTHY
                 message = "System resources critically high"
-            elif cpu_percent > 70 or memory.percent > 70 or disk.percent > 80:
+            elif cpu_percent > 70 or memory_percent > 70 or disk_percent > 80:
                 status = HealthStatus.DEGRADED
                 message = "System resources elevated"
             else:
@@ -271,10 +538,10 @@ class HealthChecker:
                 message=message,
                 details={
                     "cpu_percent": cpu_percent,
-                    "memory_percent": memory.percent,
-                    "memory_available_gb": memory.available / (1024**3),
-                    "disk_percent": disk.percent,
-                    "disk_free_gb": disk.free / (1024**3)
+                    "memory_percent": memory_percent,
+                    "memory_available_gb": memory_available / (1024**3),
+                    "disk_percent": disk_percent,
+                    "disk_free_gb": disk_free / (1024**3)
                 },
                 duration_ms=duration_ms
             )
@@ -321,22 +588,21 @@ class HealthChecker:
         start_time = time.time()
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get("http://localhost:8000/health", timeout=5.0)
-                response.raise_for_status()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                
-                return HealthCheckResult(
-                    name="api",
-                    status=HealthStatus.HEALTHY,
-                    message="API responding normally",
-                    details={
-                        "response_time_ms": duration_ms,
-                        "status_code": response.status_code
-                    },
-                    duration_ms=duration_ms
-                )
+            response = await self._http.get("http://localhost:8000/health")
+            response.raise_for_status()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            
+            return HealthCheckResult(
+                name="api",
+                status=HealthStatus.HEALTHY,
+                message="API responding normally",
+                details={
+                    "response_time_ms": duration_ms,
+                    "status_code": response.status_code
+                },
+                duration_ms=duration_ms
+            )
         except Exception as e:
             return HealthCheckResult(
                 name="api",
@@ -407,24 +673,35 @@ class HealthChecker:
         """Run all health checks"""
         results = {}
         
-        # Run checks in parallel
-        tasks = {
-            name: asyncio.create_task(check_func())
-            for name, check_func in self.checks.items()
-        }
+        # Run checks in parallel; a slow check is cut off at its own deadline
+        names = list(self.checks)
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(self.checks[name](), timeout=self._timeouts[name]) for name in names),
+            return_exceptions=True
+        )
         
-        for name, task in tasks.items():
-            try:
-                results[name] = await task
-            except Exception as e:
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
                 results[name] = HealthCheckResult(
                     name=name,
                     status=HealthStatus.UNHEALTHY,
-                    message=f"Check failed with exception: {str(e)}"
+                    message=f"Check timed out after {self._timeouts[name]}s"
                 )
+            elif isinstance(outcome, BaseException):
+                results[name] = HealthCheckResult(
+                    name=name,
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Check failed with exception: {str(outcome)}"
+                )
+            else:
+                results[name] = outcome
         
         return results
     
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._http.aclose()
+    
     def get_overall_status(self, results: Dict[str, HealthCheckResult]) -> HealthStatus:
         """Determine overall system health"""
         statuses = [result.status for result in results.values()]
@@ -437,6 +714,85 @@ class HealthChecker:
             return HealthStatus.HEALTHY
 
 
+# Metrics snapshot key read by each built-in alert; other alerts can set metadata["metric_key"]
+_ALERT_METRIC_KEYS = {
+    "high_error_rate": "error_rate",
+    "high_cpu_usage": "cpu_percent",
+    "high_vacancy_rate": "avg_vacancy_rate"
+}
+
+
+class NotificationBatcher:
+    """Queues alert notifications and delivers them per channel in batches"""
+    
+    _STOP = object()
+    
+    def __init__(self, send_batch: Callable, max_batch_size: int = 20, max_queue_time: float = 2.0):
+        self._send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """Start the background flush task"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def process(self, item: Tuple[Alert, str, str]):
+        """Queue an (alert, status, channel) notification"""
+        if self._task is None:
+            await self.start()
+        await self._queue.put(item)
+    
+    async def _run(self):
+        """Collect up to max_batch_size items or max_queue_time seconds, then flush"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_queue_time
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is self._STOP:
+                    # Deliver the in-flight batch before exiting
+                    await self.process_batch(batch)
+                    return
+                batch.append(item)
+            await self.process_batch(batch)
+    
+    async def process_batch(self, batch: List[Tuple[Alert, str, str]]):
+        """Send one payload per channel for the batch"""
+        by_channel: Dict[str, List[Tuple[Alert, str]]] = defaultdict(list)
+        for alert, status, channel in batch:
+            by_channel[channel].append((alert, status))
+        # Channels are independent, so a batch costs the slowest channel rather than the sum
+        results = await asyncio.gather(
+            *(self._send_batch(channel, notifications) for channel, notifications in by_channel.items()),
+            return_exceptions=True
+        )
+        for channel, result in zip(by_channel, results):
+            if isinstance(result, Exception):
+                logger.error("Error sending notifications", channel=channel, error=str(result))
+    
+    async def stop(self):
+        """Stop the flush task once everything queued before this call has been delivered"""
+        if self._task is None:
+            return
+        # A sentinel rather than cancel(), which would drop the batch _run is still collecting
+        await self._queue.put(self._STOP)
+        await self._task
+        self._task = None
+
+
 class AlertManager:
     """Alert management and notification system"""
     
@@ -444,6 +800,14 @@ class AlertManager:
         self.metrics = metrics_collector
         self.alerts: Dict[str, Alert] = {}
         self.alert_states: Dict[str, Dict[str, Any]] = {}
+        # alert name -> (metric key, threshold, comparison), built once at registration
+        self._evaluators: Dict[str, Tuple[str, float, Callable[[Any, Any], bool]]] = {}
+        self._channel_senders: Dict[str, Callable] = {
+            "slack": self._send_slack_notification,
+            "email": self._send_email_notification,
+            "pagerduty": self._send_pagerduty_notification
+        }
+        self._batcher = NotificationBatcher(self._send_channel_batch, max_batch_size=20, max_queue_time=2.0)
         self._register_default_alerts()
     
     def _register_default_alerts(self):
@@ -507,17 +871,28 @@ class AlertManager:
             "triggered_at": None,
             "last_notification": None
         }
+        
+        # This is a simplified evaluation; in production you'd compile the condition expression.
+        # Alerts without a known metric can never fire, so they are not evaluated at all.
+        metric_key = alert.metadata.get("metric_key") or _ALERT_METRIC_KEYS.get(alert.name)
+        if metric_key:
+            self._evaluators[alert.name] = (metric_key, alert.threshold, operator.gt)
+        else:
+            self._evaluators.pop(alert.name, None)
     
     async def check_alerts(self, current_metrics: Dict[str, Any]):
         """Check all alerts against current metrics"""
         triggered_alerts = []
         
-        for alert_name, alert in self.alerts.items():
-            if self._evaluate_alert_condition(alert, current_metrics):
+        for alert_name, (metric_key, threshold, compare) in list(self._evaluators.items()):
+            alert = self.alerts[alert_name]
+            value = current_metrics.get(metric_key, 0)
+            
+            if compare(value, threshold):
                 if not self.alert_states[alert_name]["active"]:
                     # New alert
                     self.alert_states[alert_name]["active"] = True
-                    self.alert_states[alert_name]["triggered_at"] = datetime.utcnow()
+                    self.alert_states[alert_name]["triggered_at"] = time.time_ns()
                     triggered_alerts.append(alert)
                     await self._send_alert_notification(alert, "triggered")
                     
@@ -540,81 +915,81 @@ class AlertManager:
         
         return triggered_alerts
     
-    def _evaluate_alert_condition(self, alert: Alert, metrics: Dict[str, Any]) -> bool:
-        """Evaluate if alert condition is met"""
-        # This is a simplified evaluation
-        # In production, you'd use a proper expression evaluator
-        
-        # For demonstration, check some specific conditions
-        if alert.name == "high_error_rate":
-            error_rate = metrics.get("error_rate", 0)
-            return error_rate > alert.threshold
-        elif alert.name == "high_cpu_usage":
-            cpu_usage = metrics.get("cpu_percent", 0)
-            return cpu_usage > alert.threshold
-        elif alert.name == "high_vacancy_rate":
-            vacancy_rate = metrics.get("avg_vacancy_rate", 0)
-            return vacancy_rate > alert.threshold
-        
-        return False
-    
     async def _send_alert_notification(self, alert: Alert, status: str):
         """Send alert notification"""
+        # Queued per channel; the batcher sends one payload per channel per window
         for channel in alert.notification_channels:
-            if channel == "slack":
-                await self._send_slack_notification(alert, status)
-            elif channel == "email":
-                await self._send_email_notification(alert, status)
-            elif channel == "pagerduty":
-                await self._send_pagerduty_notification(alert, status)
-    
-    async def _send_slack_notification(self, alert: Alert, status: str):
+            await self._batcher.process((alert, status, channel))
+    
+    async def _send_channel_batch(self, channel: str, notifications: List[Tuple[Alert, str]]):
+        """Deliver a batch of notifications to one channel"""
+        send = self._channel_senders.get(channel)
+        if send is not None:
+            await send(notifications)
+    
+    async def _send_slack_notification(self, notifications: List[Tuple[Alert, str]]):
         """Send Slack notification"""
-        # Implement actual Slack webhook call
+        # Implement actual Slack webhook call; one attachment per alert
         logger.info(
             "Slack notification sent",
-            alert_name=alert.name,
-            status=status,
-            severity=alert.severity
+            alerts=[
+                {"alert_name": alert.name, "status": status, "severity": alert.severity}
+                for alert, status in notifications
+            ]
         )
     
-    async def _send_email_notification(self, alert: Alert, status: str):
+    async def _send_email_notification(self, notifications: List[Tuple[Alert, str]]):
         """Send email notification"""
-        # Implement actual email sending
+        # Implement actual email sending; one digest per batch
         logger.info(
             "Email notification sent",
-            alert_name=alert.name,
-            status=status,
-            severity=alert.severity
+            alerts=[
+                {"alert_name": alert.name, "status": status, "severity": alert.severity}
+                for alert, status in notifications
+            ]
         )
     
-    async def _send_pagerduty_notification(self, alert: Alert, status: str):
+    async def _send_pagerduty_notification(self, notifications: List[Tuple[Alert, str]]):
         """Send PagerDuty notification"""
-        # Implement actual PagerDuty integration
+        # Implement actual PagerDuty integration; events sent as one batch
         logger.info(
             "PagerDuty notification sent",
-            alert_name=alert.name,
-            status=status,
-            severity=alert.severity
+            alerts=[
+                {"alert_name": alert.name, "status": status, "severity": alert.severity}
+                for alert, status in notifications
+            ]
         )
+    
+    async def aclose(self):
+        """Flush queued notifications"""
+        await self._batcher.stop()
 
 
 class MonitoringService:
     """Main monitoring service orchestrator"""
     
+    HEALTH_SNAPSHOT_MAX_AGE = 30.0
+    LOG_FLUSH_INTERVAL = 1.0
+    
     def __init__(self):
         self.metrics = MetricsCollector()
         self.health_checker = HealthChecker(self.metrics)
         self.alert_manager = AlertManager(self.metrics)
         self.is_running = False
+        # Latest CPU sample from the metrics loop, shared with the alert loop
+        self._last_cpu_percent = 0.0
+        # (monotonic time, results, overall) from the most recent health check run
+        self._last_health_snapshot: Optional[Tuple[float, Dict[str, HealthCheckResult], HealthStatus]] = None
     
     async def start(self):
         """Start monitoring service"""
         self.is_running = True
+        _log_sink.open()
         logger.info("Monitoring service started")
         
         # Start background tasks
         tasks = [
+            asyncio.create_task(self._flush_logs_loop()),
             asyncio.create_task(self._collect_metrics_loop()),
             asyncio.create_task(self._health_check_loop()),
             asyncio.create_task(self._alert_check_loop())
@@ -628,14 +1003,25 @@ class MonitoringService:
     async def stop(self):
         """Stop monitoring service"""
         self.is_running = False
+        await self.health_checker.aclose()
+        await self.alert_manager.aclose()
+        _log_sink.flush()
+    
+    async def _flush_logs_loop(self):
+        """Flush buffered log records on a timer so the file never lags far behind"""
+        while self.is_running:
+            await asyncio.sleep(self.LOG_FLUSH_INTERVAL)
+            _log_sink.flush()
     
     async def _collect_metrics_loop(self):
         """Continuously collect metrics"""
+        import psutil
+        
         while self.is_running:
             try:
                 # Collect system metrics
-                cpu_percent = psutil.cpu_percent(interval=1)
-                memory = psutil.virtual_memory()
+                # Non-blocking: usage since the previous sample, without sleeping on the event loop
+                self._last_cpu_percent = psutil.cpu_percent(interval=None)
                 
                 # Update gauges
                 self.metrics.active_connections.labels(connection_type="http").set(50)  # Example
@@ -669,6 +1055,7 @@ class MonitoringService:
             try:
                 results = await self.health_checker.run_all_checks()
                 overall_status = self.health_checker.get_overall_status(results)
+                self._last_health_snapshot = (time.monotonic(), results, overall_status)
                 
                 logger.info(
                     "Health check completed",
@@ -689,7 +1076,7 @@ class MonitoringService:
                 # Get current metrics snapshot
                 current_metrics = {
                     "error_rate": 5,  # Example values
-                    "cpu_percent": psutil.cpu_percent(),
+                    "cpu_percent": self._last_cpu_percent,
                     "avg_vacancy_rate": 0.09
                 }
                 
@@ -710,8 +1097,14 @@ class MonitoringService:
     
     async def get_status(self) -> Dict[str, Any]:
         """Get current monitoring status"""
-        health_results = await self.health_checker.run_all_checks()
-        overall_health = self.health_checker.get_overall_status(health_results)
+        # Serve the background loop's results while fresh instead of probing every dependency again
+        snapshot = self._last_health_snapshot
+        if snapshot and time.monotonic() - snapshot[0] < self.HEALTH_SNAPSHOT_MAX_AGE:
+            _, health_results, overall_health = snapshot
+        else:
+            health_results = await self.health_checker.run_all_checks()
+            overall_health = self.health_checker.get_overall_status(health_results)
+            self._last_health_snapshot = (time.monotonic(), health_results, overall_health)
         
         active_alerts = [
             alert_name
@@ -720,14 +1113,15 @@ class MonitoringService:
         ]
         
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _ns_to_iso(time.time_ns()),
             "health": {
                 "overall": overall_health.value,
                 "checks": {
                     name: {
                         "status": result.status.value,
                         "message": result.message,
-                        "duration_ms": result.duration_ms
+                        "duration_ms": result.duration_ms,
+                        "timestamp": _ns_to_iso(result.timestamp)
                     }
                     for name, result in health_results.items()
                 }
@@ -2,210 +2,172 @@
 """
 Aictive Platform v2 - Quick Start Script
 Begin your AI property management setup without import dependencies
+
+The .env and README templates are read from the templates/ directory next to this
+script, so it must be run from a full checkout rather than copied out on its own.
 """
 
 import os
+import sys
 import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-
-
-def create_directory_structure():
-    """Create the required directory structure"""
-    base_path = Path("/Users/garymartin/Downloads/aictive-platform-v2")
-    
-    directories = [
-        "agents/property_manager",
-        "agents/director_leasing", 
-        "agents/director_accounting",
-        "agents/leasing_consultant",
-        "agents/resident_services",
-        "agents/accounts_payable",
-        "agents/inspection_coordinator",
-        "agents/admin_accountant",
-        "agents/office_assistant",
-        "agents/admin_assistant",
-        "agents/vp_property_mgmt",
-        "agents/vp_operations",
-        "agents/president",
-        "workflows/maintenance",
-        "workflows/leasing",
-        "workflows/financial",
-        "workflows/compliance",
-        "documents/templates",
-        "documents/forms",
-        "documents/procedures",
-        "integrations/rentvine",
-        "integrations/email",
-        "integrations/slack",
-        "tests/unit",
-        "tests/integration",
-        "logs",
-        "cache",
-        "config"
-    ]
-    
-    created = 0
+from typing import List
+
+# orjson is optional; the script must still run on a bare interpreter
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+BASE_DIR = os.environ.get("AICTIVE_BASE", "/Users/garymartin/Downloads/aictive-platform-v2")
+# The .env template and setup README live here as plain files and are copied into place
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+STATUS_PATH = os.path.join(BASE_DIR, "setup_status.json")
+# Bump whenever the directory layout or any template changes, so existing setups re-run
+SCHEMA_VERSION = 1
+
+
+DIRECTORIES = (
+    "agents/property_manager",
+    "agents/director_leasing", 
+    "agents/director_accounting",
+    "agents/leasing_consultant",
+    "agents/resident_services",
+    "agents/accounts_payable",
+    "agents/inspection_coordinator",
+    "agents/admin_accountant",
+    "agents/office_assistant",
+    "agents/admin_assistant",
+    "agents/vp_property_mgmt",
+    "agents/vp_operations",
+    "agents/president",
+    "workflows/maintenance",
+    "workflows/leasing",
+    "workflows/financial",
+    "workflows/compliance",
+    "documents/templates",
+    "documents/forms",
+    "documents/procedures",
+    "integrations/rentvine",
+    "integrations/email",
+    "integrations/slack",
+    "tests/unit",
+    "tests/integration",
+    "logs",
+    "cache",
+    "config"
+)
+
+
+def _directory_layout(directories) -> dict:
+    """Map every directory and each of its ancestors to an absolute path, shallowest first"""
+    unique = set()
     for dir_path in directories:
-        full_path = base_path / dir_path
-        if not full_path.exists():
-            full_path.mkdir(parents=True)
-            created += 1
-            
-    print(f"✅ Created {created} directories")
-
-
-def create_env_file():
-    """Create .env template if it doesn't exist"""
-    env_path = Path("/Users/garymartin/Downloads/aictive-platform-v2/.env")
-    
-    if env_path.exists():
-        print("✅ .env file already exists")
-        return
-        
-    env_content = """# Aictive Platform v2 Configuration
-
-# AI Services
-ANTHROPIC_API_KEY=your_claude_api_key_here
-OPENAI_API_KEY=your_openai_api_key_here
-
-# Database
-SUPABASE_URL=https://your-project.supabase.co
-SUPABASE_ANON_KEY=your_supabase_key_here
-
-# Optional Services
-AZURE_VISION_KEY=optional_azure_key
-REDIS_URL=redis://localhost:6379
-RENTVINE_API_KEY=optional_rentvine_key
-SLACK_WEBHOOK_URL=optional_slack_webhook
-
-# Settings
-ENVIRONMENT=development
-DEBUG_MODE=true
-LOG_LEVEL=INFO
-"""
-    
-    with open(env_path, 'w') as f:
-        f.write(env_content)
-        
-    print("✅ Created .env template")
-    print("⚠️  Please add your API keys to .env before running the full system")
-
-
-def create_agent_configs():
-    """Create configuration files for each agent"""
-    base_path = Path("/Users/garymartin/Downloads/aictive-platform-v2/agents")
-    
-    # Agent configurations based on your 13 roles
-    agents = {
-        "property_manager": {
-            "name": "Property Manager AI",
-            "superclaude_persona": "analyzer",
-            "commands": ["thinkdeep", "context"],
-            "capabilities": [
-                "damage_assessment",
-                "tenant_communication", 
-                "owner_reporting",
-                "maintenance_coordination"
-            ],
-            "approval_limits": {"financial": 500, "emergency": "unlimited"}
-        },
-        "director_leasing": {
-            "name": "Director of Leasing AI",
-            "superclaude_persona": "frontend",
-            "commands": ["magic", "seq"],
-            "capabilities": [
-                "lead_scoring",
-                "application_processing",
-                "tour_coordination",
-                "fair_housing_compliance"
-            ],
-            "approval_limits": {"concessions": 200, "application": "full"}
-        },
-        "director_accounting": {
-            "name": "Director of Accounting AI",
-            "superclaude_persona": "data",
-            "commands": ["thinkdeep", "compressed"],
-            "capabilities": [
-                "payment_processing",
-                "financial_reporting",
-                "collections",
-                "owner_distributions"
-            ],
-            "approval_limits": {"payments": 1000, "distributions": "unlimited"}
-        }
+        parts = dir_path.split("/")
+        unique.update("/".join(parts[:depth]) for depth in range(1, len(parts) + 1))
+    return {
+        dir_path: os.path.join(BASE_DIR, dir_path)
+        for dir_path in sorted(unique, key=lambda d: d.count("/"))
     }
-    
-    for agent_key, config in agents.items():
-        agent_path = base_path / agent_key / "config.json"
-        with open(agent_path, 'w') as f:
-            json.dump(config, f, indent=2)
-            
-    print(f"✅ Created {len(agents)} agent configurations")
 
 
-def create_workflow_templates():
-    """Create basic workflow templates"""
-    base_path = Path("/Users/garymartin/Downloads/aictive-platform-v2/workflows")
-    
-    workflows = {
-        "maintenance/emergency_maintenance.json": {
-            "name": "Emergency Maintenance",
-            "priority": "immediate",
-            "steps": [
-                {"agent": "property_manager", "action": "assess_emergency"},
-                {"agent": "property_manager", "action": "dispatch_vendor"},
-                {"agent": "property_manager", "action": "notify_all_parties"}
-            ],
-            "hooks": ["emergency_detection", "immediate_response"]
-        },
-        "leasing/application_processing.json": {
-            "name": "Application Processing",
-            "priority": "high",
-            "steps": [
-                {"agent": "director_leasing", "action": "initial_screening"},
-                {"agent": "director_leasing", "action": "background_check"},
-                {"agent": "property_manager", "action": "final_approval"}
-            ],
-            "hooks": ["fair_housing_compliance", "fraud_detection"]
-        },
-        "financial/rent_collection.json": {
-            "name": "Rent Collection",
-            "priority": "scheduled",
-            "steps": [
-                {"agent": "director_accounting", "action": "process_payments"},
-                {"agent": "director_accounting", "action": "identify_delinquent"},
-                {"agent": "admin_accountant", "action": "send_notices"}
-            ],
-            "hooks": ["payment_verification", "delinquency_escalation"]
-        }
+# Every ancestor once, shallowest first, so each mkdir finds its parent already in place
+# instead of mkdir(parents=True) re-walking shared prefixes like agents/; built once at import
+_DIR_PATHS = _directory_layout(DIRECTORIES)
+_LEAF_DIRS = frozenset(DIRECTORIES)
+
+
+# Agent configurations based on your 13 roles
+AGENT_CONFIGS = {
+    "property_manager": {
+        "name": "Property Manager AI",
+        "superclaude_persona": "analyzer",
+        "commands": ["thinkdeep", "context"],
+        "capabilities": [
+            "damage_assessment",
+            "tenant_communication", 
+            "owner_reporting",
+            "maintenance_coordination"
+        ],
+        "approval_limits": {"financial": 500, "emergency": "unlimited"}
+    },
+    "director_leasing": {
+        "name": "Director of Leasing AI",
+        "superclaude_persona": "frontend",
+        "commands": ["magic", "seq"],
+        "capabilities": [
+            "lead_scoring",
+            "application_processing",
+            "tour_coordination",
+            "fair_housing_compliance"
+        ],
+        "approval_limits": {"concessions": 200, "application": "full"}
+    },
+    "director_accounting": {
+        "name": "Director of Accounting AI",
+        "superclaude_persona": "data",
+        "commands": ["thinkdeep", "compressed"],
+        "capabilities": [
+            "payment_processing",
+            "financial_reporting",
+            "collections",
+            "owner_distributions"
+        ],
+        "approval_limits": {"payments": 1000, "distributions": "unlimited"}
     }
-    
-    for workflow_path, config in workflows.items():
-        full_path = base_path / workflow_path
-        with open(full_path, 'w') as f:
-            json.dump(config, f, indent=2)
-            
-    print(f"✅ Created {len(workflows)} workflow templates")
-
+}
+
+WORKFLOW_TEMPLATES = {
+    "maintenance/emergency_maintenance.json": {
+        "name": "Emergency Maintenance",
+        "priority": "immediate",
+        "steps": [
+            {"agent": "property_manager", "action": "assess_emergency"},
+            {"agent": "property_manager", "action": "dispatch_vendor"},
+            {"agent": "property_manager", "action": "notify_all_parties"}
+        ],
+        "hooks": ["emergency_detection", "immediate_response"]
+    },
+    "leasing/application_processing.json": {
+        "name": "Application Processing",
+        "priority": "high",
+        "steps": [
+            {"agent": "director_leasing", "action": "initial_screening"},
+            {"agent": "director_leasing", "action": "background_check"},
+            {"agent": "property_manager", "action": "final_approval"}
+        ],
+        "hooks": ["fair_housing_compliance", "fraud_detection"]
+    },
+    "financial/rent_collection.json": {
+        "name": "Rent Collection",
+        "priority": "scheduled",
+        "steps": [
+            {"agent": "director_accounting", "action": "process_payments"},
+            {"agent": "director_accounting", "action": "identify_delinquent"},
+            {"agent": "admin_accountant", "action": "send_notices"}
+        ],
+        "hooks": ["payment_verification", "delinquency_escalation"]
+    }
+}
 
-def create_sample_data():
-    """Create sample data for testing"""
-    base_path = Path("/Users/garymartin/Downloads/aictive-platform-v2/tests")
-    
+# Test fixtures carry a pinned timestamp so every run writes identical bytes
+SAMPLE_DATA = {
     # Sample maintenance request
-    maintenance_sample = {
+    "sample_maintenance_request.json": {
         "type": "maintenance",
         "description": "Water leak under kitchen sink",
         "property_id": "PROP-001",
         "unit_id": "UNIT-101",
         "tenant_name": "John Doe",
         "images": ["leak_photo_1.jpg", "leak_photo_2.jpg"],
-        "reported_at": datetime.utcnow().isoformat()
-    }
-    
+        "reported_at": "2024-01-01T00:00:00"
+    },
     # Sample lease application
-    application_sample = {
+    "sample_lease_application.json": {
         "type": "application",
         "applicant_name": "Jane Smith",
         "income": 75000,
@@ -214,164 +176,236 @@ def create_sample_data():
         "desired_unit": "UNIT-201",
         "move_date": "2024-02-15"
     }
+}
+
+
+def _read_template(name: str) -> bytes:
+    """Read a static template shipped alongside this script"""
+    path = os.path.join(TEMPLATE_DIR, name)
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        sys.exit(f"❌ Missing template {path}; run quick_start.py from a checkout that includes templates/")
+
+
+# Fallback when orjson is missing: one shared encoder rather than a fresh one per json.dumps call
+_ENC = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return _ENC(obj).encode()
+
+
+# The templates are static, so they are serialized once at import rather than on every run
+_AGENT_JSON = {key: _dumps(config) for key, config in AGENT_CONFIGS.items()}
+_WORKFLOW_JSON = {path: _dumps(config) for path, config in WORKFLOW_TEMPLATES.items()}
+_SAMPLE_JSON = {name: _dumps(sample) for name, sample in SAMPLE_DATA.items()}
+_README_BYTES = _read_template("README_SETUP.md")
+
+
+def _flush_report(report: List[str]):
+    """Write collected progress lines to stdout in one call and empty the list"""
+    if report:
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
+        report.clear()
+
+
+def _matches(path: str, data: bytes) -> bool:
+    """Whether the file at path already holds exactly data"""
+    # Raw descriptors rather than open(): no buffered file object is built around the read
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        # One byte past the payload is enough to tell a longer file apart
+        return os.read(fd, len(data) + 1) == data
+    finally:
+        os.close(fd)
+
+
+def _write_if_changed(path: str, data: bytes):
+    """Write a whole file in one call, skipping it when the content on disk already matches"""
+    if _matches(path, data):
+        return
     
-    # Save samples
-    with open(base_path / "sample_maintenance_request.json", 'w') as f:
-        json.dump(maintenance_sample, f, indent=2)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _copy_template_if_changed(name: str, path: str, data: bytes):
+    """Copy a template file into place unless path already holds its content (data)"""
+    if _matches(path, data):
+        return
+    # copyfile hands the copy to the kernel (sendfile / copy_file_range) on Linux
+    shutil.copyfile(os.path.join(TEMPLATE_DIR, name), path)
+
+
+def _existing_dirs(base: str, wanted) -> set:
+    """Relative paths in wanted that already exist, from one scandir per existing parent"""
+    existing = set()
+    pending = [""]
+    while pending:
+        rel = pending.pop()
+        with os.scandir(os.path.join(base, rel)) as entries:
+            for entry in entries:
+                child = f"{rel}/{entry.name}" if rel else entry.name
+                if child in wanted and entry.is_dir():
+                    existing.add(child)
+                    pending.append(child)
+    return existing
+
+
+def create_directory_structure() -> List[str]:
+    """Create the required directory structure; returns its progress lines"""
+    os.makedirs(BASE_DIR, exist_ok=True)
+    existing = _existing_dirs(BASE_DIR, _DIR_PATHS)
+    created = 0
+    for dir_path, full_path in _DIR_PATHS.items():
+        if dir_path in existing:
+            continue
+        try:
+            os.mkdir(full_path)
+        except FileExistsError:
+            # Made by a concurrent run since the scan; not ours to count
+            continue
+        created += dir_path in _LEAF_DIRS
+            
+    return [f"✅ Created {created} directories"]
+
+
+def create_env_file() -> List[str]:
+    """Create .env template if it doesn't exist; returns its progress lines"""
+    env_path = os.path.join(BASE_DIR, ".env")
+    
+    # Open the template first so a missing one never leaves an empty .env behind
+    with open(os.path.join(TEMPLATE_DIR, "env.template"), 'rb') as src:
+        # O_EXCL makes the existence check and the create one atomic step, so a concurrent
+        # run can never overwrite keys already filled in
+        try:
+            fd = os.open(env_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return ["✅ .env file already exists"]
         
-    with open(base_path / "sample_lease_application.json", 'w') as f:
-        json.dump(application_sample, f, indent=2)
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        except BaseException:
+            # A partial .env would read as "already exists" on every later run
+            os.unlink(env_path)
+            raise
         
-    print("✅ Created sample test data")
-
-
-def create_readme():
-    """Create a comprehensive README"""
-    readme_content = """# Aictive Platform v2 - Setup Complete! 🎉
-
-## 🚀 Quick Start
-
-### 1. Add Your API Keys
-Edit the `.env` file and add your API keys:
-- `ANTHROPIC_API_KEY` - Get from https://console.anthropic.com
-- `OPENAI_API_KEY` - Get from https://platform.openai.com
-- `SUPABASE_URL` & `SUPABASE_ANON_KEY` - From your Supabase project
-
-### 2. Install Dependencies
-```bash
-pip3 install -r requirements.txt
-```
-
-### 3. Run the Full Implementation
-```bash
-python3 start_implementation.py
-```
-
-## 📁 Directory Structure
-
-```
-aictive-platform-v2/
-├── agents/               # 13 AI agent configurations
-│   ├── property_manager/
-│   ├── director_leasing/
-│   └── ... (11 more roles)
-├── workflows/            # Automated workflows
-│   ├── maintenance/
-│   ├── leasing/
-│   └── financial/
-├── documents/           # Your system manuals & templates
-├── integrations/        # External service connections
-└── tests/              # Test scenarios
-```
-
-## 🤖 Your 13 AI Agents
-
-1. **Property Manager** - Main operational hub
-2. **Director of Leasing** - Application & tenant acquisition
-3. **Director of Accounting** - Financial operations
-4. **Leasing Consultant** - Front-line leasing support
-5. **Resident Services** - Tenant lifecycle management
-6. **Accounts Payable** - Vendor payments
-7. **Inspection Coordinator** - Property inspections
-8. **Admin Accountant** - Collections & compliance
-9. **Office Assistant** - Administrative support
-10. **Admin Assistant** - Document management
-11. **VP Property Management** - Strategic oversight
-12. **VP Operations** - Operational excellence
-13. **President** - Executive decisions
-
-## 🔄 Core Workflows
-
-- **Emergency Maintenance** - Immediate response system
-- **Application Processing** - Automated screening & approval
-- **Rent Collection** - Payment processing & delinquency
-- **Lease Renewals** - Proactive renewal management
-- **Owner Reporting** - Automated financial statements
-
-## 🎯 Next Steps
-
-1. **Test Basic Functions**
-   ```python
-   python3 test_basic_agent.py
-   ```
-
-2. **Import Your Documents**
-   ```python
-   python3 import_documents.py
-   ```
-
-3. **Configure Integrations**
-   - Set up RentVine API
-   - Configure email automation
-   - Enable Slack notifications
-
-4. **Deploy to Production**
-   - Push to GitHub
-   - Deploy on Vercel
-   - Monitor performance
-
-## 📊 Success Metrics
-
-- **Response Time**: <5 minutes (vs 2-4 hours manual)
-- **Automation Rate**: 85%+ of routine tasks
-- **Accuracy**: 95%+ for standard operations
-- **Cost Savings**: 80% reduction in operational costs
-
-## 🆘 Support
-
-- Documentation: `/docs`
-- Logs: `/logs`
-- Support: support@aictive.com
-
----
-
-**Your AI property management revolution starts now!** 🚀
-"""
+    return [
+        "✅ Created .env template",
+        "⚠️  Please add your API keys to .env before running the full system"
+    ]
+
+
+def create_agent_configs() -> List[str]:
+    """Create configuration files for each agent; returns its progress lines"""
+    base_path = os.path.join(BASE_DIR, "agents")
     
-    with open("/Users/garymartin/Downloads/aictive-platform-v2/README_SETUP.md", 'w') as f:
-        f.write(readme_content)
+    for agent_key, blob in _AGENT_JSON.items():
+        _write_if_changed(os.path.join(base_path, agent_key, "config.json"), blob)
+            
+    return [f"✅ Created {len(_AGENT_JSON)} agent configurations"]
+
+
+def create_workflow_templates() -> List[str]:
+    """Create basic workflow templates; returns its progress lines"""
+    base_path = os.path.join(BASE_DIR, "workflows")
+    
+    for workflow_path, blob in _WORKFLOW_JSON.items():
+        _write_if_changed(os.path.join(base_path, workflow_path), blob)
+            
+    return [f"✅ Created {len(_WORKFLOW_JSON)} workflow templates"]
+
+
+def create_sample_data() -> List[str]:
+    """Create sample data for testing; returns its progress lines"""
+    base_path = os.path.join(BASE_DIR, "tests")
+    
+    for file_name, blob in _SAMPLE_JSON.items():
+        _write_if_changed(os.path.join(base_path, file_name), blob)
         
-    print("✅ Created setup README")
+    return ["✅ Created sample test data"]
+
+
+def create_readme() -> List[str]:
+    """Create a comprehensive README; returns its progress lines"""
+    _copy_template_if_changed("README_SETUP.md", os.path.join(BASE_DIR, "README_SETUP.md"), _README_BYTES)
+        
+    return ["✅ Created setup README"]
+
+
+SETUP_STEPS = (
+    create_env_file,
+    create_agent_configs,
+    create_workflow_templates,
+    create_sample_data,
+    create_readme
+)
+
+
+def _already_set_up() -> bool:
+    """Whether setup_status.json records a completed run of the current schema"""
+    try:
+        with open(STATUS_PATH, 'rb') as f:
+            status = json.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return False
+    return isinstance(status, dict) and status.get("schema_version") == SCHEMA_VERSION
 
 
 def main():
     """Run the quick start setup"""
-    print("""
+    if _already_set_up():
+        print(f"✅ Quick start already completed; delete {STATUS_PATH} to run it again")
+        return
+    
+    now = datetime.utcnow().isoformat()
+    # Progress lines are collected per phase and written out at each boundary in one call
+    report = ["""
     ╔═══════════════════════════════════════════════════════════╗
     ║          AICTIVE PLATFORM V2 - QUICK START                ║
     ║                                                           ║
     ║  Setting up your AI Property Management System            ║
     ╚═══════════════════════════════════════════════════════════╝
-    """)
-    
-    print("\n📁 Creating directory structure...")
-    create_directory_structure()
-    
-    print("\n🔐 Creating environment configuration...")
-    create_env_file()
-    
-    print("\n🤖 Creating agent configurations...")
-    create_agent_configs()
-    
-    print("\n⚙️ Creating workflow templates...")
-    create_workflow_templates()
+    """]
     
-    print("\n📊 Creating sample data...")
-    create_sample_data()
+    report.append("\n📁 Creating directory structure...")
+    report.extend(create_directory_structure())
+    _flush_report(report)
     
-    print("\n📝 Creating documentation...")
-    create_readme()
+    # Every later step writes under its own subtree, so they run side by side once the
+    # directories exist; their lines are reported in SETUP_STEPS order, not completion order
+    report.append("\n📝 Writing configuration, agents, workflows, sample data and documentation...")
+    with ThreadPoolExecutor(max_workers=len(SETUP_STEPS)) as executor:
+        futures = [executor.submit(step) for step in SETUP_STEPS]
+    for future in futures:
+        report.extend(future.result())
     
-    print("\n✅ Quick start setup complete!")
-    print("\n📋 Next steps:")
-    print("1. Add your API keys to the .env file")
-    print("2. Run: python3 start_implementation.py")
-    print("3. Test with sample data in /tests")
-    print("4. Import your property management documents")
+    report.append("\n✅ Quick start setup complete!")
+    report.append("\n📋 Next steps:")
+    report.append("1. Add your API keys to the .env file")
+    report.append("2. Run: python3 start_implementation.py")
+    report.append("3. Test with sample data in /tests")
+    report.append("4. Import your property management documents")
     
     # Create a status file
     status = {
-        "setup_completed": datetime.utcnow().isoformat(),
+        "schema_version": SCHEMA_VERSION,
+        "setup_completed": now,
         "directories_created": True,
         "env_file_created": True,
         "agents_configured": 3,
@@ -379,8 +413,8 @@ def main():
         "next_step": "Add API keys to .env file"
     }
     
-    with open("/Users/garymartin/Downloads/aictive-platform-v2/setup_status.json", 'w') as f:
-        json.dump(status, f, indent=2)
+    _write_if_changed(STATUS_PATH, _dumps(status))
+    _flush_report(report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""
+Tests for NotificationBatcher delivery and shutdown in production_monitoring
+"""
+import asyncio
+
+from production_monitoring import Alert, NotificationBatcher
+
+
+def _alert(name: str) -> Alert:
+    return Alert(name=name, condition="error_rate > threshold", threshold=0.05,
+                 duration_seconds=60, severity="warning")
+
+
+class RecordingSender:
+    """send_batch stand-in that records deliveries and fails for chosen channels"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.delivered = {}
+
+    async def __call__(self, channel, notifications):
+        if channel in self.failing:
+            raise RuntimeError(f"{channel} is down")
+        self.delivered.setdefault(channel, []).extend(alert.name for alert, _ in notifications)
+
+
+class TestNotificationBatcher:
+    """Batching, per-channel isolation and shutdown"""
+
+    def test_stop_flushes_queued_notifications(self):
+        sender = RecordingSender()
+
+        async def run():
+            # A long queue time keeps the batch open, so only stop() can deliver it
+            batcher = NotificationBatcher(sender, max_batch_size=50, max_queue_time=60.0)
+            for i in range(3):
+                await batcher.process((_alert(f"alert_{i}"), "firing", "slack"))
+            await batcher.stop()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=5))
+        assert sender.delivered == {"slack": ["alert_0", "alert_1", "alert_2"]}
+
+    def test_failing_channel_does_not_drop_other_channels(self):
+        sender = RecordingSender(failing={"pagerduty"})
+
+        async def run():
+            batcher = NotificationBatcher(sender, max_batch_size=50, max_queue_time=60.0)
+            await batcher.process((_alert("cpu"), "firing", "pagerduty"))
+            await batcher.process((_alert("cpu"), "firing", "slack"))
+            await batcher.process((_alert("disk"), "firing", "email"))
+            await batcher.stop()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=5))
+        assert sender.delivered == {"slack": ["cpu"], "email": ["disk"]}
+
+    def test_full_batch_is_sent_without_waiting(self):
+        sender = RecordingSender()
+
+        async def run():
+            batcher = NotificationBatcher(sender, max_batch_size=2, max_queue_time=60.0)
+            await batcher.process((_alert("a"), "firing", "slack"))
+            await batcher.process((_alert("b"), "firing", "slack"))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            delivered_before_stop = dict(sender.delivered)
+            await batcher.stop()
+            return delivered_before_stop
+
+        assert asyncio.run(asyncio.wait_for(run(), timeout=5)) == {"slack": ["a", "b"]}
+
+    def test_stop_is_idempotent(self):
+        sender = RecordingSender()
+
+        async def run():
+            batcher = NotificationBatcher(sender, max_batch_size=50, max_queue_time=60.0)
+            # Stopping a batcher that never started is a no-op
+            await batcher.stop()
+            await batcher.process((_alert("cpu"), "firing", "slack"))
+            await batcher.stop()
+            await batcher.stop()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=5))
+        assert sender.delivered == {"slack": ["cpu"]}
@@ -0,0 +1,156 @@
+"""
+Parity tests for the numeric kernels in predictive_maintenance_ai
+Each kernel is checked against the pandas / np.polyfit reference it replaced,
+once compiled with numba and once on the NumPy fallback
+"""
+import importlib.util
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import predictive_maintenance_ai
+
+
+# Row lengths for the NaN-padded matrix, including a single-reading series
+LENGTHS = [12, 1, 30, 2, 25]
+
+
+def _load_without_numba(monkeypatch):
+    """Import a fresh copy of the module with numba hidden, so the NumPy fallbacks are bound"""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.spec_from_file_location(
+        "predictive_maintenance_ai_without_numba", predictive_maintenance_ai.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def kernels(request, monkeypatch):
+    """The module with its kernels compiled by numba, or bound to the NumPy fallbacks"""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        assert predictive_maintenance_ai.NUMBA_AVAILABLE
+        return predictive_maintenance_ai
+    module = _load_without_numba(monkeypatch)
+    assert not module.NUMBA_AVAILABLE
+    return module
+
+
+@pytest.fixture
+def padded():
+    """(float32 NaN-padded matrix, row lengths, the unpadded float32 rows)"""
+    rng = np.random.default_rng(7)
+    rows = [
+        (50 + np.cumsum(rng.normal(size=n)) + 0.1 * np.arange(n)).astype(np.float32)
+        for n in LENGTHS
+    ]
+    values = np.full((len(rows), max(LENGTHS)), np.nan, dtype=np.float32)
+    for i, row in enumerate(rows):
+        values[i, :len(row)] = row
+    return values, np.array(LENGTHS, dtype=np.intp), rows
+
+
+def _reference_slope(row: np.ndarray) -> float:
+    """Degree-1 np.polyfit slope, the baseline trend computation"""
+    if len(row) < 2:
+        return np.nan
+    return np.polyfit(np.arange(len(row)), row.astype(np.float64), 1)[0]
+
+
+def _reference_zscores(row: np.ndarray) -> np.ndarray:
+    """Absolute pandas z-scores, the baseline anomaly computation"""
+    series = pd.Series(row.astype(np.float64))
+    return np.abs((series - series.mean()) / series.std()).to_numpy()
+
+
+class TestRowStats:
+    """Batched mean / std / slope against pandas and np.polyfit"""
+
+    def test_matches_pandas_and_polyfit(self, kernels, padded):
+        values, lengths, rows = padded
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            means, stds, slopes = kernels._row_stats(values, lengths)
+
+        for i, row in enumerate(rows):
+            series = pd.Series(row.astype(np.float64))
+            assert means[i] == pytest.approx(series.mean(), rel=1e-6)
+            assert slopes[i] == pytest.approx(_reference_slope(row), rel=1e-4, abs=1e-6, nan_ok=True)
+            assert stds[i] == pytest.approx(series.std(), rel=1e-5, nan_ok=True)
+
+    def test_single_reading_has_nan_std_and_slope(self, kernels):
+        values = np.array([[4.0, np.nan, np.nan]], dtype=np.float32)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            means, stds, slopes = kernels._row_stats(values, np.array([1], dtype=np.intp))
+
+        assert means[0] == 4.0
+        assert np.isnan(stds[0])
+        assert np.isnan(slopes[0])
+
+    @pytest.mark.skipif(not predictive_maintenance_ai.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_fused_and_padded_agree(self, padded):
+        values, lengths, _ = padded
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            fused = predictive_maintenance_ai._fused_stats(values, lengths)
+            reference = predictive_maintenance_ai._padded_stats(values, lengths)
+
+        for got, expected in zip(fused, reference):
+            np.testing.assert_allclose(got, expected, rtol=1e-5, atol=1e-6, equal_nan=True)
+
+
+class TestTrendSlope:
+    """Closed-form slope against np.polyfit"""
+
+    @pytest.mark.parametrize("n", [2, 3, 10, 200])
+    def test_matches_polyfit(self, kernels, n):
+        y = np.random.default_rng(n).normal(size=n) + 0.05 * np.arange(n)
+        assert kernels._trend_slope(y) == pytest.approx(_reference_slope(y), rel=1e-9, abs=1e-12)
+
+    def test_single_reading_is_nan(self, kernels):
+        assert np.isnan(kernels._trend_slope(np.array([3.0])))
+
+
+class TestZScores:
+    """Row-broadcast z-scores against pandas, with NaN padding never flagged"""
+
+    def test_matches_pandas_on_padded_rows(self, kernels, padded):
+        values, lengths, rows = padded
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            scores = kernels._zscores(values)
+
+        for i, row in enumerate(rows):
+            np.testing.assert_allclose(
+                scores[i, :len(row)], _reference_zscores(row), rtol=1e-5, atol=1e-6, equal_nan=True
+            )
+            assert np.isnan(scores[i, len(row):]).all()
+
+    def test_single_reading_is_nan(self, kernels):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            assert np.isnan(kernels._zscores(np.array([3.0]))).all()
+
+
+class TestHoltForecast:
+    """Holt smoothing against a plain Python loop"""
+
+    def test_matches_python_loop(self, kernels):
+        y = np.random.default_rng(3).normal(size=40).cumsum()
+        alpha, beta = 0.3, 0.1
+
+        level, trend = y[0], y[1] - y[0]
+        for value in y[1:]:
+            previous_level = level
+            level = alpha * value + (1 - alpha) * (level + trend)
+            trend = beta * (level - previous_level) + (1 - beta) * trend
+        expected = [level + trend * step for step in range(1, 8)]
+
+        np.testing.assert_allclose(kernels._holt_forecast(y, 7, alpha, beta), expected, rtol=1e-12)
@@ -0,0 +1,73 @@
+"""
+Tests for the quick_start setup script, run against a temporary AICTIVE_BASE
+"""
+import importlib
+import os
+
+import pytest
+
+
+@pytest.fixture
+def quick_start(tmp_path, monkeypatch):
+    """quick_start re-imported so BASE_DIR and STATUS_PATH point into tmp_path"""
+    monkeypatch.setenv("AICTIVE_BASE", str(tmp_path))
+    import quick_start
+    yield importlib.reload(quick_start)
+    monkeypatch.delenv("AICTIVE_BASE")
+    importlib.reload(quick_start)
+
+
+class TestQuickStart:
+    """Idempotent setup and .env safety"""
+
+    def test_first_run_writes_status_and_files(self, quick_start, tmp_path):
+        quick_start.main()
+
+        assert quick_start._already_set_up()
+        assert (tmp_path / ".env").is_file()
+        assert (tmp_path / "README_SETUP.md").is_file()
+        assert (tmp_path / "agents" / "property_manager" / "config.json").is_file()
+        assert (tmp_path / "workflows" / "leasing" / "application_processing.json").is_file()
+
+    def test_second_run_skips(self, quick_start, tmp_path, capsys, monkeypatch):
+        quick_start.main()
+        capsys.readouterr()
+
+        def fail():
+            raise AssertionError("setup ran again")
+
+        monkeypatch.setattr(quick_start, "create_directory_structure", fail)
+        quick_start.main()
+
+        assert "already completed" in capsys.readouterr().out
+
+    def test_reruns_after_status_file_is_deleted(self, quick_start, tmp_path):
+        quick_start.main()
+        os.remove(quick_start.STATUS_PATH)
+        (tmp_path / "README_SETUP.md").unlink()
+
+        quick_start.main()
+
+        assert quick_start._already_set_up()
+        assert (tmp_path / "README_SETUP.md").is_file()
+
+    def test_existing_env_is_not_overwritten(self, quick_start, tmp_path, capsys):
+        env_path = tmp_path / ".env"
+        env_path.write_text("OPENAI_API_KEY=sk-filled-in\n")
+
+        quick_start.main()
+
+        assert env_path.read_text() == "OPENAI_API_KEY=sk-filled-in\n"
+        assert ".env file already exists" in capsys.readouterr().out
+
+    def test_failed_template_copy_leaves_no_env(self, quick_start, tmp_path, monkeypatch):
+        def broken_copy(src, dst):
+            dst.write(b"PARTIAL=")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(quick_start.shutil, "copyfileobj", broken_copy)
+
+        with pytest.raises(OSError, match="disk full"):
+            quick_start.create_env_file()
+
+        assert not (tmp_path / ".env").exists()